@@ -1,5 +1,6 @@
 """Entry point for python -m calendar."""
-from .server import mcp
+from .server import mcp, warm_up
 
 if __name__ == "__main__":
+    warm_up()
     mcp.run()
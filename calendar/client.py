@@ -1,24 +1,139 @@
 """Google Calendar API client wrapper."""
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Optional
 import logging
+import re
+import threading
 
+from googleapiclient.errors import HttpError
+
+from shared.cache import DiskTTLCache, TTLCache
+from shared.retry import execute_with_retry
 from .models import CalendarInfo, Event, BusyBlock, FreeSlot
 
 logger = logging.getLogger("google_mcps.calendar")
 
+# Partial-response masks: request only the fields the models actually parse
+_EVENT_FIELDS = "id,summary,start,end,description,location,attendees/email,status,htmlLink"
+_EVENT_LIST_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken"
+_EVENT_SYNC_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken,nextSyncToken"
+_CALENDAR_FIELDS = "id,summary,description,timeZone,primary"
+_CALENDAR_LIST_FIELDS = f"items({_CALENDAR_FIELDS}),nextPageToken"
+
+# FreeBusy accepts at most 50 calendars per request
+_FREEBUSY_MAX_ITEMS = 50
+
+# The per-API batch endpoint accepts at most 50 subrequests per call
+_BATCH_MAX_REQUESTS = 50
+
+# Short TTL for all-free FreeBusy windows: empty results are cheap to
+# re-fetch but must go stale quickly in case an event lands in the window
+_FREEBUSY_EMPTY_TTL = 30.0
+
+# Worker threads for parallel fan-out; each keeps its own keep-alive socket
+_POOL_WORKERS = 8
+
+# How long to keep ETags for conditional re-fetches. Much longer than the
+# read cache: a 304 revalidation is nearly free, so stale tags only cost
+# one wasted request header.
+_ETAG_TTL = 3600.0
+
+# The calendar list changes rarely but is refetched at every MCP process
+# launch; a day-long disk cache removes that cold-start round trip
+_CALENDAR_LIST_DISK_TTL = 86400.0
+
+
+def _event_time(dt_data: dict) -> str:
+    """ISO timestamp for an event boundary (dateTime for timed, date for all-day)."""
+    return dt_data.get("dateTime") or dt_data.get("date") or ""
+
+
+@lru_cache(maxsize=1024)
+def _to_rfc3339(dt: datetime) -> str:
+    """
+    Convert datetime to RFC3339 format for Google API.
+
+    Cached because the same time_min/time_max datetimes are re-formatted
+    for every chunk of a bulk FreeBusy query and for cache keys.
+
+    Args:
+        dt: datetime object (timezone-aware or naive)
+
+    Returns:
+        RFC3339 formatted string
+    """
+    # Ensure timezone-aware
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.isoformat()
+
 
 class CalendarClient:
     """Wrapper for Google Calendar API operations."""
 
-    def __init__(self, service):
+    def __init__(
+        self,
+        service,
+        cache_ttl: float = 120.0,
+        data_dir: Optional[Path] = None,
+    ):
         """
         Initialize the Calendar client.
 
         Args:
             service: Google Calendar API service object
+            cache_ttl: Seconds to cache read results (0 disables caching)
+            data_dir: App data directory for caches that should survive
+                process restarts (None disables them)
         """
         self.service = service
+        # Collection accessors allocate a fresh Resource wrapper per
+        # call; build each once and reuse it for every request
+        self._events = service.events()
+        self._calendars = service.calendarList()
+        self._freebusy = service.freebusy()
+        self.cache_ttl = cache_ttl
+        self._cache = TTLCache(maxsize=256, ttl=cache_ttl)
+        # Calendar list persisted across process launches
+        self._calendar_list_disk: Optional[DiskTTLCache] = None
+        if data_dir is not None:
+            self._calendar_list_disk = DiskTTLCache(
+                data_dir / "cache" / "calendar_list.json",
+                ttl=_CALENDAR_LIST_DISK_TTL,
+            )
+        # Incremental-sync tokens, mirrored to disk so sync state
+        # survives process restarts
+        self._sync_token_dir = data_dir / "sync_tokens" if data_dir else None
+        self._sync_tokens: dict[str, str] = {}
+        # ETag + raw body kept past the read TTL for If-None-Match refreshes
+        self._etags = TTLCache(maxsize=256, ttl=_ETAG_TTL)
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Times an all-free FreeBusy window was answered from cache
+        self.negative_cache_hits = 0
+
+    def invalidate(self, calendar_id: str) -> None:
+        """
+        Drop cached reads that could be stale after a write to a calendar.
+
+        Called by create_event/update_event/delete_event so reads within
+        the cache TTL see the write.
+        """
+        def touches_calendar(key) -> bool:
+            # Keys are ("method", calendar_id_or_ids, ...); list_calendars
+            # has no calendar component and is unaffected by event writes.
+            if len(key) < 2:
+                return False
+            scope = key[1]
+            if isinstance(scope, tuple):
+                return calendar_id in scope
+            return scope == calendar_id
+
+        self._cache.invalidate(touches_calendar)
 
     def list_calendars(self) -> list[CalendarInfo]:
         """
@@ -27,18 +142,44 @@ class CalendarClient:
         Returns:
             List of CalendarInfo objects
         """
-        try:
-            result = self.service.calendarList().list().execute()
-        except Exception as e:
-            logger.error(f"Failed to list calendars: {e}")
-            raise
+        cache_key = ("list_calendars",)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fall back to the on-disk copy before going to the network: the
+        # calendar list is refetched on every process launch but changes
+        # rarely, so a day-old copy is almost always still right
+        items = None
+        if self._calendar_list_disk is not None:
+            items = self._calendar_list_disk.load()
+
+        if items is None:
+            try:
+                result = execute_with_retry(
+                    self._calendars.list(fields=_CALENDAR_LIST_FIELDS)
+                )
+            except Exception as e:
+                logger.error(f"Failed to list calendars: {e}")
+                raise
+            items = result.get("items", [])
+            if self._calendar_list_disk is not None:
+                self._calendar_list_disk.store(items)
 
         calendars = []
-        for item in result.get("items", []):
+        for item in items:
             calendars.append(CalendarInfo.from_api_response(item))
 
+        self._cache.set(cache_key, calendars)
         return calendars
 
+    def refresh_calendars(self) -> list[CalendarInfo]:
+        """Drop both calendar-list caches and refetch from the API."""
+        self._cache.pop(("list_calendars",))
+        if self._calendar_list_disk is not None:
+            self._calendar_list_disk.invalidate()
+        return self.list_calendars()
+
     def get_calendar(self, calendar_id: str = "primary") -> CalendarInfo:
         """
         Get info about a specific calendar.
@@ -50,7 +191,11 @@ class CalendarClient:
             CalendarInfo object
         """
         try:
-            result = self.service.calendarList().get(calendarId=calendar_id).execute()
+            result = execute_with_retry(
+                self._calendars.get(
+                    calendarId=calendar_id, fields=_CALENDAR_FIELDS
+                )
+            )
         except Exception as e:
             logger.error(f"Failed to get calendar {calendar_id}: {e}")
             raise
@@ -63,6 +208,7 @@ class CalendarClient:
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
         max_results: int = 100,
+        expand_recurring: bool = True,
     ) -> list[Event]:
         """
         List events in a time range.
@@ -72,9 +218,13 @@ class CalendarClient:
             time_min: Start of time range (defaults to now)
             time_max: End of time range (defaults to 7 days from now)
             max_results: Maximum number of events to return
+            expand_recurring: Expand recurring events into occurrences.
+                Set False to get master events only, which is cheaper
+                server-side and smaller on the wire.
 
         Returns:
-            List of Event objects, ordered by start time
+            List of Event objects, ordered by start time (by last update
+            when expand_recurring is False)
         """
         # Default time range: now to 7 days from now
         if time_min is None:
@@ -83,31 +233,372 @@ class CalendarClient:
             time_max = time_min + timedelta(days=7)
 
         # Convert to RFC3339 format
-        time_min_str = self._to_rfc3339(time_min)
-        time_max_str = self._to_rfc3339(time_max)
+        time_min_str = _to_rfc3339(time_min)
+        time_max_str = _to_rfc3339(time_max)
+
+        cache_key = (
+            "list_events",
+            calendar_id,
+            time_min_str,
+            time_max_str,
+            max_results,
+            expand_recurring,
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        events = list(
+            islice(
+                self.iter_events(
+                    calendar_id,
+                    time_min,
+                    time_max,
+                    page_size=max_results,
+                    expand_recurring=expand_recurring,
+                ),
+                max_results,
+            )
+        )
 
-        try:
-            result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min_str,
-                    timeMax=time_max_str,
-                    maxResults=max_results,
-                    singleEvents=True,  # Expand recurring events
-                    orderBy="startTime",
+        self._cache.set(cache_key, events)
+        return events
+
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        page_size: int = 250,
+        expand_recurring: bool = True,
+    ) -> Iterator[Event]:
+        """
+        Iterate events in a time range, following pagination transparently.
+
+        Yields Event objects lazily, fetching the next page only when the
+        current one is exhausted, so callers can stop early without paying
+        for the remaining pages.
+
+        Args:
+            calendar_id: Calendar ID or "primary"
+            time_min: Start of time range (defaults to now)
+            time_max: End of time range (defaults to 7 days from now)
+            page_size: Events to request per page
+            expand_recurring: Expand recurring events into occurrences
+
+        Yields:
+            Event objects, ordered by start time when expanding.
+            The API only accepts orderBy="startTime" with singleEvents=True,
+            so unexpanded listings fall back to update-time order.
+        """
+        if time_min is None:
+            time_min = datetime.now(timezone.utc)
+        if time_max is None:
+            time_max = time_min + timedelta(days=7)
+
+        for item in self._iter_event_items(
+            calendar_id, time_min, time_max, page_size, expand_recurring
+        ):
+            yield Event.from_api_response(item)
+
+    def _iter_event_items(
+        self,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+        page_size: int,
+        expand_recurring: bool,
+    ) -> Iterator[dict]:
+        """Yield raw event item dicts, following pagination."""
+        time_min_str = _to_rfc3339(time_min)
+        time_max_str = _to_rfc3339(time_max)
+
+        page_token = None
+        while True:
+            try:
+                result = execute_with_retry(
+                    self._events.list(
+                        calendarId=calendar_id,
+                        timeMin=time_min_str,
+                        timeMax=time_max_str,
+                        maxResults=page_size,
+                        singleEvents=expand_recurring,
+                        orderBy="startTime" if expand_recurring else "updated",
+                        pageToken=page_token,
+                        fields=_EVENT_LIST_FIELDS,
+                    ),
+                    http=self._thread_http(),
                 )
-                .execute()
-            )
-        except Exception as e:
-            logger.error(f"Failed to list events: {e}")
+            except Exception as e:
+                logger.error(f"Failed to list events: {e}")
+                raise
+
+            yield from result.get("items", [])
+
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+
+    def list_events_incremental(
+        self,
+        calendar_id: str = "primary",
+        page_size: int = 250,
+    ) -> tuple[list[Event], list[str]]:
+        """
+        Fetch only the events that changed since the last call.
+
+        Uses the Calendar API's sync tokens: the first call lists the
+        whole calendar and stores the returned nextSyncToken; later
+        calls pass it back and receive just the delta, which for a
+        polling agent is typically near-empty instead of the full
+        window. Tokens persist to disk, so the delta carries across
+        process restarts. An expired token (HTTP 410) transparently
+        falls back to a full resync.
+
+        Args:
+            calendar_id: Calendar ID or "primary"
+            page_size: Events to request per page
+
+        Returns:
+            Tuple of (changed events, deleted event IDs); callers can
+            merge both into their own copy of the calendar
+        """
+        token = self._load_sync_token(calendar_id)
+        try:
+            return self._sync_pass(calendar_id, token, page_size)
+        except HttpError as e:
+            if token is not None and e.resp is not None and e.resp.status == 410:
+                # Token expired server-side; start over with a full sync
+                self._clear_sync_token(calendar_id)
+                return self._sync_pass(calendar_id, None, page_size)
+            logger.error(f"Failed incremental sync for {calendar_id}: {e}")
             raise
 
-        events = []
-        for item in result.get("items", []):
-            events.append(Event.from_api_response(item))
+    def _sync_pass(
+        self,
+        calendar_id: str,
+        sync_token: Optional[str],
+        page_size: int,
+    ) -> tuple[list[Event], list[str]]:
+        """One full or incremental sync sweep, following pagination."""
+        changed: list[Event] = []
+        deleted: list[str] = []
+
+        page_token = None
+        while True:
+            params = {
+                "calendarId": calendar_id,
+                "maxResults": page_size,
+                "singleEvents": True,
+                "pageToken": page_token,
+                "fields": _EVENT_SYNC_FIELDS,
+            }
+            if sync_token:
+                params["syncToken"] = sync_token
+
+            result = execute_with_retry(
+                self._events.list(**params), http=self._thread_http()
+            )
 
-        return events
+            for item in result.get("items", []):
+                # Deltas report removals as cancelled stubs
+                if item.get("status") == "cancelled":
+                    deleted.append(item.get("id", ""))
+                else:
+                    changed.append(Event.from_api_response(item))
+
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+
+        next_token = result.get("nextSyncToken")
+        if next_token:
+            self._store_sync_token(calendar_id, next_token)
+
+        return changed, deleted
+
+    def _sync_token_path(self, calendar_id: str) -> Optional[Path]:
+        """File holding a calendar's sync token, or None if not persisted."""
+        if self._sync_token_dir is None:
+            return None
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", calendar_id)
+        return self._sync_token_dir / safe
+
+    def _load_sync_token(self, calendar_id: str) -> Optional[str]:
+        """Sync token from memory, falling back to the on-disk copy."""
+        token = self._sync_tokens.get(calendar_id)
+        if token:
+            return token
+
+        path = self._sync_token_path(calendar_id)
+        if path is not None:
+            try:
+                return path.read_text(encoding="utf-8").strip() or None
+            except OSError:
+                return None
+        return None
+
+    def _store_sync_token(self, calendar_id: str, token: str) -> None:
+        """Remember a sync token, mirroring it to disk best-effort."""
+        self._sync_tokens[calendar_id] = token
+        path = self._sync_token_path(calendar_id)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(token, encoding="utf-8")
+            except OSError:
+                pass
+
+    def _clear_sync_token(self, calendar_id: str) -> None:
+        """Forget a calendar's sync token in memory and on disk."""
+        self._sync_tokens.pop(calendar_id, None)
+        path = self._sync_token_path(calendar_id)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def list_events_dict(
+        self,
+        calendar_id: str = "primary",
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 100,
+        expand_recurring: bool = True,
+    ) -> list[dict]:
+        """
+        List events as pre-shaped plain dicts.
+
+        For tools that only re-serialize events to JSON, this skips the
+        Event dataclass round-trip: the API's RFC3339 timestamps pass
+        through as-is instead of being parsed and re-formatted.
+
+        Args:
+            calendar_id: Calendar ID or "primary"
+            time_min: Start of time range (defaults to now)
+            time_max: End of time range (defaults to 7 days from now)
+            max_results: Maximum number of events to return
+            expand_recurring: Expand recurring events into occurrences
+
+        Returns:
+            List of dicts with id, summary, start, end, location,
+            attendees, status, and html_link keys
+        """
+        if time_min is None:
+            time_min = datetime.now(timezone.utc)
+        if time_max is None:
+            time_max = time_min + timedelta(days=7)
+
+        cache_key = (
+            "list_events_dict",
+            calendar_id,
+            _to_rfc3339(time_min),
+            _to_rfc3339(time_max),
+            max_results,
+            expand_recurring,
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        rows = [
+            {
+                "id": item.get("id", ""),
+                "summary": item.get("summary", "(No title)"),
+                "start": _event_time(item.get("start", {})),
+                "end": _event_time(item.get("end", {})),
+                "location": item.get("location"),
+                "attendees": [
+                    attendee["email"]
+                    for attendee in item.get("attendees", [])
+                    if attendee.get("email")
+                ],
+                "status": item.get("status", "confirmed"),
+                "html_link": item.get("htmlLink"),
+            }
+            for item in islice(
+                self._iter_event_items(
+                    calendar_id, time_min, time_max, max_results, expand_recurring
+                ),
+                max_results,
+            )
+        ]
+
+        self._cache.set(cache_key, rows)
+        return rows
+
+    def list_events_many(
+        self,
+        calendar_ids: list[str],
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 100,
+    ) -> dict[str, list[Event]]:
+        """
+        List events from several calendars in parallel.
+
+        Fetches each calendar on a worker thread so N calendars cost
+        roughly one round-trip instead of N sequential ones.
+
+        Args:
+            calendar_ids: Calendar IDs to fetch
+            time_min: Start of time range (defaults to now)
+            time_max: End of time range (defaults to 7 days from now)
+            max_results: Maximum number of events per calendar
+
+        Returns:
+            Dict mapping calendar_id -> list of Event objects
+        """
+        if not calendar_ids:
+            return {}
+
+        if len(calendar_ids) == 1:
+            cal_id = calendar_ids[0]
+            return {cal_id: self.list_events(cal_id, time_min, time_max, max_results)}
+
+        def fetch(cal_id: str) -> tuple[str, list[Event]]:
+            self._ensure_worker_http()
+            return cal_id, self.list_events(cal_id, time_min, time_max, max_results)
+
+        return dict(self._executor().map(fetch, calendar_ids))
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """
+        Persistent worker pool for parallel fan-out.
+
+        Kept alive for the life of the client so worker threads (and the
+        keep-alive sockets in their per-thread transports) are reused
+        across tool calls instead of paying a TLS handshake every time.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="calendar-io"
+            )
+        return self._pool
+
+    def _thread_http(self):
+        """HTTP transport for the current thread, or None for the service default."""
+        return getattr(self._local, "http", None)
+
+    def _ensure_worker_http(self) -> None:
+        """
+        Give the current worker thread its own HTTP transport.
+
+        httplib2 connections are not thread-safe, so parallel fetches must
+        not share the service's default transport.
+        """
+        if getattr(self._local, "http", None) is not None:
+            return
+
+        import httplib2
+        import google_auth_httplib2
+
+        creds = getattr(getattr(self.service, "_http", None), "credentials", None)
+        if creds is not None:
+            self._local.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http()
+            )
 
     def get_event(self, event_id: str, calendar_id: str = "primary") -> Event:
         """
@@ -120,17 +611,89 @@ class CalendarClient:
         Returns:
             Event object
         """
+        cache_key = ("get_event", calendar_id, event_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._fetch_event(calendar_id, event_id)
+
+        event = Event.from_api_response(result)
+        self._cache.set(cache_key, event)
+        return event
+
+    def _fetch_event(self, calendar_id: str, event_id: str) -> dict:
+        """
+        Fetch a raw event, revalidating with If-None-Match when possible.
+
+        When the read cache has expired but we still hold the event's
+        ETag, the server answers 304 with no body if nothing changed,
+        skipping the download and re-parse.
+        """
+        etag_key = ("event_etag", calendar_id, event_id)
+        stale = self._etags.get(etag_key)
+
+        request = self._events.get(
+            calendarId=calendar_id, eventId=event_id, fields=_EVENT_FIELDS + ",etag"
+        )
+        if stale is not None:
+            request.headers["If-None-Match"] = stale[0]
+
         try:
-            result = (
-                self.service.events()
-                .get(calendarId=calendar_id, eventId=event_id)
-                .execute()
-            )
+            result = execute_with_retry(request, http=self._thread_http())
+        except HttpError as e:
+            if stale is not None and e.resp is not None and e.resp.status == 304:
+                return stale[1]
+            logger.error(f"Failed to get event {event_id}: {e}")
+            raise
         except Exception as e:
             logger.error(f"Failed to get event {event_id}: {e}")
             raise
 
-        return Event.from_api_response(result)
+        etag = result.get("etag")
+        if etag:
+            self._etags.set(etag_key, (etag, result))
+        return result
+
+    def get_event_dict(self, event_id: str, calendar_id: str = "primary") -> dict:
+        """
+        Get a specific event as a pre-shaped plain dict.
+
+        Like list_events_dict, this keeps the API's ISO timestamps as
+        strings for callers that only re-serialize them.
+
+        Args:
+            event_id: The event ID
+            calendar_id: Calendar ID or "primary"
+
+        Returns:
+            Dict with id, summary, start, end, description, location,
+            attendees, status, and html_link keys
+        """
+        cache_key = ("get_event_dict", calendar_id, event_id)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._fetch_event(calendar_id, event_id)
+
+        row = {
+            "id": result.get("id", ""),
+            "summary": result.get("summary", "(No title)"),
+            "start": _event_time(result.get("start", {})),
+            "end": _event_time(result.get("end", {})),
+            "description": result.get("description"),
+            "location": result.get("location"),
+            "attendees": [
+                attendee["email"]
+                for attendee in result.get("attendees", [])
+                if attendee.get("email")
+            ],
+            "status": result.get("status", "confirmed"),
+            "html_link": result.get("htmlLink"),
+        }
+        self._cache.set(cache_key, row)
+        return row
 
     def query_free_busy(
         self,
@@ -149,14 +712,34 @@ class CalendarClient:
         Returns:
             Dict mapping calendar_id -> list of BusyBlock
         """
+        time_min_str = _to_rfc3339(time_min)
+        time_max_str = _to_rfc3339(time_max)
+
+        cache_key = (
+            "query_free_busy",
+            tuple(sorted(calendar_ids)),
+            time_min_str,
+            time_max_str,
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            if not any(cached.values()):
+                self.negative_cache_hits += 1
+            return cached
+
         body = {
-            "timeMin": self._to_rfc3339(time_min),
-            "timeMax": self._to_rfc3339(time_max),
+            "timeMin": time_min_str,
+            "timeMax": time_max_str,
             "items": [{"id": cal_id} for cal_id in calendar_ids],
         }
 
         try:
-            result = self.service.freebusy().query(body=body).execute()
+            result = execute_with_retry(
+                # Only the per-calendar busy lists are used; drop the
+                # echoed kind/timeMin/timeMax envelope from the response
+                self._freebusy.query(body=body, fields="calendars"),
+                http=self._thread_http(),
+            )
         except Exception as e:
             logger.error(f"Failed to query free/busy: {e}")
             raise
@@ -171,6 +754,100 @@ class CalendarClient:
                 busy_blocks.append(BusyBlock.from_api_response(block))
             busy_map[cal_id] = busy_blocks
 
+        # All-free windows are common (off-hours, sparse calendars) and
+        # worth suppressing repeat calls for, but only briefly in case an
+        # event lands in the window
+        if not any(busy_map.values()):
+            self._cache.set(cache_key, busy_map, ttl=_FREEBUSY_EMPTY_TTL)
+        else:
+            self._cache.set(cache_key, busy_map)
+        return busy_map
+
+    def query_free_busy_bulk(
+        self,
+        calendar_ids: list[str],
+        time_min: datetime,
+        time_max: datetime,
+    ) -> dict[str, list[BusyBlock]]:
+        """
+        Query busy times for any number of calendars.
+
+        The FreeBusy API takes at most 50 calendars per request, so larger
+        inputs are split into chunks and the chunks queried in parallel.
+
+        Args:
+            calendar_ids: List of calendar IDs to check
+            time_min: Start of time range
+            time_max: End of time range
+
+        Returns:
+            Dict mapping calendar_id -> list of BusyBlock
+        """
+        if len(calendar_ids) <= _FREEBUSY_MAX_ITEMS:
+            return self.query_free_busy(calendar_ids, time_min, time_max)
+
+        time_min_str = _to_rfc3339(time_min)
+        time_max_str = _to_rfc3339(time_max)
+        chunks = [
+            calendar_ids[i : i + _FREEBUSY_MAX_ITEMS]
+            for i in range(0, len(calendar_ids), _FREEBUSY_MAX_ITEMS)
+        ]
+
+        busy_map: dict[str, list[BusyBlock]] = {}
+        errors: list[Exception] = []
+
+        def on_chunk(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+                return
+            for cal_id, cal_data in response.get("calendars", {}).items():
+                busy_map[cal_id] = [
+                    BusyBlock.from_api_response(block)
+                    for block in cal_data.get("busy", [])
+                ]
+
+        # Pack all chunk queries into batch requests instead of one HTTPS
+        # request per chunk. The batch endpoint itself caps at 50
+        # subrequests, so group chunks accordingly.
+        batches = []
+        for start in range(0, len(chunks), _BATCH_MAX_REQUESTS):
+            batch = self.service.new_batch_http_request(callback=on_chunk)
+            for chunk in chunks[start : start + _BATCH_MAX_REQUESTS]:
+                batch.add(
+                    self._freebusy.query(
+                        body={
+                            "timeMin": time_min_str,
+                            "timeMax": time_max_str,
+                            "items": [{"id": cal_id} for cal_id in chunk],
+                        },
+                        fields="calendars",
+                    )
+                )
+            batches.append(batch)
+
+        def run(batch) -> None:
+            self._ensure_worker_http()
+            batch.execute(http=self._thread_http())
+
+        try:
+            if len(batches) == 1:
+                batches[0].execute(http=self._thread_http())
+            else:
+                # Multiple batches (>2500 calendars) run concurrently on
+                # the worker pool, each over its own keep-alive transport
+                for _ in self._executor().map(run, batches):
+                    pass
+        except Exception as e:
+            logger.error(f"Failed to query free/busy batch: {e}")
+            raise
+
+        if errors:
+            raise errors[0]
+
+        # Calendars the API omitted (e.g. no access) come back empty
+        for cal_id in calendar_ids:
+            busy_map.setdefault(cal_id, [])
+
         return busy_map
 
     def find_free_slots(
@@ -194,75 +871,81 @@ class CalendarClient:
         Returns:
             List of FreeSlot objects representing available times
         """
-        # 1. Query FreeBusy for all calendars
-        busy_map = self.query_free_busy(calendar_ids, time_min, time_max)
-
-        # 2. Merge busy blocks across all calendars
-        all_busy: list[BusyBlock] = []
-        for blocks in busy_map.values():
-            all_busy.extend(blocks)
-        merged_busy = self._merge_busy_blocks(all_busy)
-
-        # 3. Find gaps in the busy times
-        gaps = self._find_gaps(merged_busy, time_min, time_max)
-
-        # 4. Filter to working hours and minimum duration
+        # 1. Query FreeBusy for all calendars (chunked at the API limit)
+        busy_map = self.query_free_busy_bulk(calendar_ids, time_min, time_max)
+
+        # 2. Merge busy blocks across all calendars. The merge and gap scans
+        #    run on plain (start, end) tuples; BusyBlock objects stay at the
+        #    API boundary.
+        all_busy = [
+            (block.start, block.end)
+            for blocks in busy_map.values()
+            for block in blocks
+        ]
+        merged_busy = self._merge_intervals(all_busy)
+
+        # 3. Build the working-hours grid once for the whole range
+        work_intervals = self._filter_to_working_hours(
+            time_min, time_max, working_hours
+        )
+
+        # 4. Subtract busy time from the grid in a single two-pointer sweep:
+        #    both lists are sorted, so each busy block is visited once
         free_slots = []
-        for gap_start, gap_end in gaps:
-            # Split gap into working hours segments across days
-            working_slots = self._filter_to_working_hours(
-                gap_start, gap_end, working_hours
-            )
-            for slot_start, slot_end in working_slots:
-                duration = int((slot_end - slot_start).total_seconds() / 60)
-                if duration >= duration_minutes:
-                    free_slots.append(FreeSlot.create(slot_start, slot_end))
+        min_duration = timedelta(minutes=duration_minutes)
+        i = 0
+        n = len(merged_busy)
+
+        for work_start, work_end in work_intervals:
+            cursor = work_start
+
+            # Drop busy blocks that ended before this working window
+            while i < n and merged_busy[i][1] <= cursor:
+                i += 1
+
+            j = i
+            while j < n and merged_busy[j][0] < work_end:
+                busy_start, busy_end = merged_busy[j]
+                if busy_start > cursor and busy_start - cursor >= min_duration:
+                    free_slots.append(FreeSlot.create(cursor, busy_start))
+                if busy_end > cursor:
+                    cursor = busy_end
+                if busy_end >= work_end:
+                    break
+                j += 1
+
+            if cursor < work_end and work_end - cursor >= min_duration:
+                free_slots.append(FreeSlot.create(cursor, work_end))
 
         return free_slots
 
     @staticmethod
-    def _merge_busy_blocks(blocks: list[BusyBlock]) -> list[BusyBlock]:
-        """Merge overlapping busy blocks into non-overlapping sorted list."""
-        if not blocks:
+    def _merge_intervals(
+        intervals: list[tuple[datetime, datetime]],
+    ) -> list[tuple[datetime, datetime]]:
+        """Merge overlapping (start, end) tuples into a sorted disjoint list."""
+        if not intervals:
             return []
 
-        # Sort by start time
-        sorted_blocks = sorted(blocks, key=lambda b: b.start)
-        merged = [sorted_blocks[0]]
-
-        for block in sorted_blocks[1:]:
-            last = merged[-1]
-            if block.start <= last.end:
-                # Overlapping or adjacent - merge
-                merged[-1] = BusyBlock(
-                    start=last.start,
-                    end=max(last.end, block.end)
-                )
+        # Sort in place (list.sort avoids the copy sorted() makes) and
+        # consume via an iterator rather than slicing off the head
+        intervals.sort()
+        merged = []
+        it = iter(intervals)
+        cur_start, cur_end = next(it)
+
+        for start, end in it:
+            if start <= cur_end:
+                # Overlapping or adjacent - extend the open interval
+                if end > cur_end:
+                    cur_end = end
             else:
-                merged.append(block)
+                merged.append((cur_start, cur_end))
+                cur_start, cur_end = start, end
 
+        merged.append((cur_start, cur_end))
         return merged
 
-    @staticmethod
-    def _find_gaps(
-        busy_blocks: list[BusyBlock],
-        time_min: datetime,
-        time_max: datetime,
-    ) -> list[tuple[datetime, datetime]]:
-        """Find gaps between busy blocks within the time range."""
-        gaps = []
-        current = time_min
-
-        for block in busy_blocks:
-            if block.start > current:
-                gaps.append((current, block.start))
-            current = max(current, block.end)
-
-        if current < time_max:
-            gaps.append((current, time_max))
-
-        return gaps
-
     @staticmethod
     def _filter_to_working_hours(
         start: datetime,
@@ -277,31 +960,29 @@ class CalendarClient:
         work_start_hour, work_end_hour = working_hours
         slots = []
 
+        # Hoist per-day constants out of the loop
+        tz = start.tzinfo or timezone.utc
+        work_start_time = dt_time(work_start_hour, tzinfo=tz)
+        work_end_time = dt_time(work_end_hour, tzinfo=tz)
+        one_day = timedelta(days=1)
+
         current_day = start.date()
         end_day = end.date()
 
         while current_day <= end_day:
-            # Working hours for this day
-            day_work_start = datetime(
-                current_day.year, current_day.month, current_day.day,
-                work_start_hour, 0, 0,
-                tzinfo=start.tzinfo or timezone.utc
-            )
-            day_work_end = datetime(
-                current_day.year, current_day.month, current_day.day,
-                work_end_hour, 0, 0,
-                tzinfo=start.tzinfo or timezone.utc
-            )
+            # Skip weekends before building any datetime objects
+            if current_day.weekday() < 5:  # Mon-Fri
+                day_work_start = datetime.combine(current_day, work_start_time)
+                day_work_end = datetime.combine(current_day, work_end_time)
 
-            # Clamp to the original range
-            slot_start = max(start, day_work_start)
-            slot_end = min(end, day_work_end)
+                # Clamp to the original range
+                slot_start = max(start, day_work_start)
+                slot_end = min(end, day_work_end)
 
-            # Only add if valid range on a weekday
-            if slot_start < slot_end and current_day.weekday() < 5:  # Mon-Fri
-                slots.append((slot_start, slot_end))
+                if slot_start < slot_end:
+                    slots.append((slot_start, slot_end))
 
-            current_day += timedelta(days=1)
+            current_day += one_day
 
         return slots
 
@@ -334,8 +1015,8 @@ class CalendarClient:
         """
         event_body: dict = {
             "summary": summary,
-            "start": {"dateTime": self._to_rfc3339(start)},
-            "end": {"dateTime": self._to_rfc3339(end)},
+            "start": {"dateTime": _to_rfc3339(start)},
+            "end": {"dateTime": _to_rfc3339(end)},
         }
 
         if description:
@@ -346,21 +1027,59 @@ class CalendarClient:
             event_body["attendees"] = [{"email": email} for email in attendees]
 
         try:
-            result = (
-                self.service.events()
-                .insert(
+            result = execute_with_retry(
+                self._events.insert(
                     calendarId=calendar_id,
                     body=event_body,
                     sendNotifications=send_notifications,
-                )
-                .execute()
+                ),
+                http=self._thread_http(),
             )
         except Exception as e:
             logger.error(f"Failed to create event: {e}")
             raise
 
+        self.invalidate(calendar_id)
         return Event.from_api_response(result)
 
+    def create_events_bulk(
+        self,
+        events: list[dict],
+        max_concurrency: int = 5,
+    ) -> list[Event | Exception]:
+        """
+        Create several events in parallel.
+
+        Each entry is a dict of keyword arguments for create_event.
+        Concurrency is bounded below the worker-pool size to stay inside
+        Google's per-user write rate limit, and a failed create is
+        returned in its slot instead of aborting the rest of the batch
+        (the retry wrapper already absorbs transient 403/429s).
+
+        Args:
+            events: List of create_event keyword-argument dicts
+            max_concurrency: Maximum in-flight create requests
+
+        Returns:
+            List of created Event objects or the Exception for that entry,
+            in the same order as the input
+        """
+        if not events:
+            return []
+
+        semaphore = threading.BoundedSemaphore(max_concurrency)
+
+        def create(kwargs: dict) -> Event | Exception:
+            self._ensure_worker_http()
+            with semaphore:
+                try:
+                    return self.create_event(**kwargs)
+                except Exception as e:
+                    logger.warning(f"Bulk create failed for {kwargs.get('summary')}: {e}")
+                    return e
+
+        return list(self._executor().map(create, events))
+
     def update_event(
         self,
         event_id: str,
@@ -390,10 +1109,8 @@ class CalendarClient:
         """
         # First, get the existing event
         try:
-            existing = (
-                self.service.events()
-                .get(calendarId=calendar_id, eventId=event_id)
-                .execute()
+            existing = execute_with_retry(
+                self._events.get(calendarId=calendar_id, eventId=event_id)
             )
         except Exception as e:
             logger.error(f"Failed to get event for update: {e}")
@@ -403,24 +1120,25 @@ class CalendarClient:
         if summary is not None:
             existing["summary"] = summary
         if start is not None:
-            existing["start"] = {"dateTime": self._to_rfc3339(start)}
+            existing["start"] = {"dateTime": _to_rfc3339(start)}
         if end is not None:
-            existing["end"] = {"dateTime": self._to_rfc3339(end)}
+            existing["end"] = {"dateTime": _to_rfc3339(end)}
         if description is not None:
             existing["description"] = description
         if location is not None:
             existing["location"] = location
 
         try:
-            result = (
-                self.service.events()
-                .update(calendarId=calendar_id, eventId=event_id, body=existing)
-                .execute()
+            result = execute_with_retry(
+                self._events.update(
+                    calendarId=calendar_id, eventId=event_id, body=existing
+                )
             )
         except Exception as e:
             logger.error(f"Failed to update event {event_id}: {e}")
             raise
 
+        self.invalidate(calendar_id)
         return Event.from_api_response(result)
 
     def delete_event(
@@ -441,29 +1159,17 @@ class CalendarClient:
             True if successful
         """
         try:
-            self.service.events().delete(
-                calendarId=calendar_id,
-                eventId=event_id,
-                sendNotifications=send_notifications,
-            ).execute()
+            execute_with_retry(
+                self._events.delete(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    sendNotifications=send_notifications,
+                )
+            )
         except Exception as e:
             logger.error(f"Failed to delete event {event_id}: {e}")
             raise
 
+        self.invalidate(calendar_id)
         return True
 
-    @staticmethod
-    def _to_rfc3339(dt: datetime) -> str:
-        """
-        Convert datetime to RFC3339 format for Google API.
-
-        Args:
-            dt: datetime object (timezone-aware or naive)
-
-        Returns:
-            RFC3339 formatted string
-        """
-        # Ensure timezone-aware
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.isoformat()
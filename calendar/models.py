@@ -3,8 +3,23 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Any
 
+try:
+    # Optional C parser; ~10x faster and handles the Z suffix natively
+    import ciso8601
+except ImportError:
+    ciso8601 = None
 
-@dataclass
+
+def _parse_rfc3339(dt_str: str) -> datetime:
+    """Parse an RFC3339 timestamp from the API."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(dt_str)
+    if dt_str.endswith("Z"):
+        dt_str = dt_str.replace("Z", "+00:00")
+    return datetime.fromisoformat(dt_str)
+
+
+@dataclass(slots=True)
 class CalendarInfo:
     """Information about a calendar."""
     id: str
@@ -25,7 +40,7 @@ class CalendarInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A calendar event."""
     id: str
@@ -72,11 +87,7 @@ class Event:
         """Parse datetime from API response (handles both dateTime and date)."""
         if "dateTime" in dt_data:
             # Full datetime with timezone
-            dt_str = dt_data["dateTime"]
-            # Handle ISO format with timezone
-            if dt_str.endswith("Z"):
-                return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-            return datetime.fromisoformat(dt_str)
+            return _parse_rfc3339(dt_data["dateTime"])
         elif "date" in dt_data:
             # All-day event (date only)
             return datetime.fromisoformat(dt_data["date"])
@@ -84,7 +95,7 @@ class Event:
             return datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class BusyBlock:
     """A block of busy time from FreeBusy API."""
     start: datetime
@@ -96,19 +107,13 @@ class BusyBlock:
         start_str = data.get("start", "")
         end_str = data.get("end", "")
 
-        # Handle Z suffix for UTC
-        if start_str.endswith("Z"):
-            start_str = start_str.replace("Z", "+00:00")
-        if end_str.endswith("Z"):
-            end_str = end_str.replace("Z", "+00:00")
-
         return cls(
-            start=datetime.fromisoformat(start_str) if start_str else datetime.now(),
-            end=datetime.fromisoformat(end_str) if end_str else datetime.now(),
+            start=_parse_rfc3339(start_str) if start_str else datetime.now(),
+            end=_parse_rfc3339(end_str) if end_str else datetime.now(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FreeSlot:
     """An available time slot."""
     start: datetime
@@ -1,5 +1,7 @@
 """Calendar MCP Server - Google Calendar operations via Model Context Protocol."""
+import logging
 import os
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -10,6 +12,23 @@ from shared.auth import GoogleAuth, CALENDAR_SCOPES
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import CalendarClient
 
+logger = logging.getLogger("google_mcps.calendar")
+
+# Splits comma-separated lists, absorbing surrounding whitespace in one pass
+_LIST_SPLIT_RE = re.compile(r"[,\s]+")
+
+# Pre-bound time constants for the hot tool paths
+_UTC = timezone.utc
+_DAY_DELTAS = {days: timedelta(days=days) for days in (1, 7, 14, 30)}
+
+
+def _days_ahead_window(days_ahead: int) -> tuple[datetime, datetime]:
+    """(now, now + days_ahead) in UTC, reusing cached deltas for common spans."""
+    time_min = datetime.now(_UTC)
+    delta = _DAY_DELTAS.get(days_ahead) or timedelta(days=days_ahead)
+    return time_min, time_min + delta
+
+
 # Initialize the MCP server
 mcp = FastMCP("calendar")
 
@@ -52,13 +71,40 @@ def get_calendar_client() -> CalendarClient:
     )
 
     creds = auth.get_credentials()
-    service = build("calendar", "v3", credentials=creds)
-    client = CalendarClient(service=service)
+
+    # Share one keep-alive transport across all tool calls instead of
+    # letting build() manage its own
+    import httplib2
+    import google_auth_httplib2
+
+    authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+    service = build(
+        "calendar",
+        "v3",
+        http=authed_http,
+        static_discovery=True,  # Use the packaged discovery doc; no HTTP fetch
+        cache_discovery=False,
+    )
+    client = CalendarClient(service=service, data_dir=paths.data_dir)
 
     _calendar_client = client
     return _calendar_client
 
 
+def warm_up() -> None:
+    """
+    Build the authenticated client before the first tool call.
+
+    Credential refresh and discovery-doc parsing otherwise land on
+    whichever tool is invoked first. Missing credentials are not fatal
+    here — the per-tool error message tells the user how to authenticate.
+    """
+    try:
+        get_calendar_client()
+    except Exception as e:
+        logger.info(f"Calendar client warm-up skipped: {e}")
+
+
 # =============================================================================
 # CALENDAR READ OPERATIONS (4 tools)
 # =============================================================================
@@ -107,30 +153,17 @@ def list_events(
     """
     client = get_calendar_client()
 
-    time_min = datetime.now(timezone.utc)
-    time_max = time_min + timedelta(days=days_ahead)
+    time_min, time_max = _days_ahead_window(days_ahead)
 
-    events = client.list_events(
+    # Pre-shaped dicts from the client; the API's timestamps are already
+    # ISO-formatted, so there is no datetime round-trip to pay here
+    return client.list_events_dict(
         calendar_id=calendar_id,
         time_min=time_min,
         time_max=time_max,
         max_results=limit,
     )
 
-    return [
-        {
-            "id": event.id,
-            "summary": event.summary,
-            "start": event.start.isoformat(),
-            "end": event.end.isoformat(),
-            "location": event.location,
-            "attendees": event.attendees,
-            "status": event.status,
-            "html_link": event.html_link,
-        }
-        for event in events
-    ]
-
 
 @mcp.tool()
 def get_event(event_id: str, calendar_id: str = "primary") -> dict:
@@ -145,19 +178,7 @@ def get_event(event_id: str, calendar_id: str = "primary") -> dict:
         Event details with id, summary, start, end, description, location, attendees, status.
     """
     client = get_calendar_client()
-    event = client.get_event(event_id=event_id, calendar_id=calendar_id)
-
-    return {
-        "id": event.id,
-        "summary": event.summary,
-        "start": event.start.isoformat(),
-        "end": event.end.isoformat(),
-        "description": event.description,
-        "location": event.location,
-        "attendees": event.attendees,
-        "status": event.status,
-        "html_link": event.html_link,
-    }
+    return client.get_event_dict(event_id=event_id, calendar_id=calendar_id)
 
 
 @mcp.tool()
@@ -188,10 +209,9 @@ def find_free_slots(
     client = get_calendar_client()
 
     # Parse comma-separated calendar IDs
-    cal_ids = [cid.strip() for cid in calendar_ids.split(",")]
+    cal_ids = [cid for cid in _LIST_SPLIT_RE.split(calendar_ids) if cid]
 
-    time_min = datetime.now(timezone.utc)
-    time_max = time_min + timedelta(days=days_ahead)
+    time_min, time_max = _days_ahead_window(days_ahead)
 
     slots = client.find_free_slots(
         calendar_ids=cal_ids,
@@ -248,15 +268,13 @@ def create_event(
     # Parse start time
     start = datetime.fromisoformat(start_time)
     if start.tzinfo is None:
-        start = start.replace(tzinfo=timezone.utc)
+        start = start.replace(tzinfo=_UTC)
 
     # Calculate end time
     end = start + timedelta(minutes=duration_minutes)
 
     # Parse attendees
-    attendee_list = None
-    if attendees:
-        attendee_list = [email.strip() for email in attendees.split(",") if email.strip()]
+    attendee_list = [email for email in _LIST_SPLIT_RE.split(attendees) if email] or None
 
     event = client.create_event(
         summary=summary,
@@ -314,7 +332,7 @@ def update_event(
     if start_time:
         start = datetime.fromisoformat(start_time)
         if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
+            start = start.replace(tzinfo=_UTC)
         if duration_minutes > 0:
             end = start + timedelta(minutes=duration_minutes)
 
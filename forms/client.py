@@ -1,50 +1,186 @@
 """Google Forms API client wrapper."""
-from typing import Optional
 import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain
+from typing import Optional
 
-from .models import Form, Question, FormResponse, Answer, ResponseSummary
+from shared.cache import TTLCache
+
+from .models import Form, Question, FormResponse, Answer, ResponseSummary, _fast_isoformat
 
 logger = logging.getLogger("google_mcps.forms")
 
+# Worker threads for overlapping independent API calls; each keeps its
+# own keep-alive transport (httplib2 is not thread-safe)
+_POOL_WORKERS = 4
+
+# Seconds to cache full response listings; long enough for a dashboard
+# asking per-question stats on one form, short enough to pick up new
+# submissions quickly
+_RESPONSES_TTL = 60.0
+
 
 class FormsClient:
     """Wrapper for Google Forms API operations (read-only)."""
 
-    def __init__(self, service):
+    def __init__(self, service, form_cache_ttl: float = 300.0):
         """
         Initialize the Forms client.
 
         Args:
             service: Google Forms API service object
+            form_cache_ttl: Seconds to cache form structures (default 5 min;
+                form structure changes rarely relative to responses)
         """
         self.service = service
+        self._form_cache = TTLCache(maxsize=64, ttl=form_cache_ttl)
+        # Responses change more often than structure; keep this TTL short
+        self._responses_cache = TTLCache(maxsize=64, ttl=_RESPONSES_TTL)
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Persistent worker pool, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="forms-io"
+            )
+        return self._pool
+
+    def _thread_http(self):
+        """HTTP transport for the current thread, or None for the service default."""
+        return getattr(self._local, "http", None)
+
+    def _ensure_worker_http(self) -> None:
+        """
+        Give the current worker thread its own authorized transport.
+
+        httplib2 connections are not thread-safe, so each pool thread gets
+        a dedicated AuthorizedHttp sharing the service's credentials.
+        """
+        if getattr(self._local, "http", None) is None:
+            import httplib2
+            import google_auth_httplib2
+
+            creds = self.service._http.credentials
+            self._local.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http()
+            )
+
+    def invalidate_form(self, form_id: str) -> None:
+        """Drop the cached structure for a form (e.g. after editing it)."""
+        self._form_cache.pop(form_id)
+        self._form_cache.pop(("questions", form_id))
+
+    def invalidate_responses(self, form_id: str) -> None:
+        """Drop cached response listings for a form."""
+        self._responses_cache.pop(form_id)
 
     def get_form(self, form_id: str) -> Form:
         """
         Get form structure including all questions.
 
+        Structure is cached per form ID, so the helpers that need both the
+        form and its responses only pay one forms().get() round-trip.
+
         Args:
             form_id: The form ID (from the Google Forms URL)
 
         Returns:
             Form object with title, description, and questions
         """
+        cached = self._form_cache.get(form_id)
+        if cached is not None:
+            return cached
+
+        try:
+            result = (
+                self.service.forms()
+                .get(formId=form_id)
+                .execute(http=self._thread_http())
+            )
+        except Exception as e:
+            logger.error(f"Failed to get form {form_id}: {e}")
+            raise
+
+        form = Form.from_api_response(result)
+        self._form_cache.set(form_id, form)
+        return form
+
+    def list_questions(self, form_id: str) -> list[Question]:
+        """
+        Get just the questions of a form.
+
+        Uses a field mask so the response carries only the question
+        items — no info block or responder URI — which trims both the
+        bytes on the wire and the parse for question-only callers.
+
+        Args:
+            form_id: The form ID
+
+        Returns:
+            List of Question objects in form order
+        """
+        cache_key = ("questions", form_id)
+        cached = self._form_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # A cached full form already has everything we need
+        form = self._form_cache.get(form_id)
+        if form is not None:
+            return form.questions
+
         try:
-            result = self.service.forms().get(formId=form_id).execute()
+            result = (
+                self.service.forms()
+                .get(formId=form_id, fields="items(title,description,questionItem)")
+                .execute(http=self._thread_http())
+            )
         except Exception as e:
             logger.error(f"Failed to get form {form_id}: {e}")
             raise
 
-        return Form.from_api_response(result)
+        questions = [
+            Question.from_api_response(item)
+            for item in result.get("items", ())
+            if "questionItem" in item
+        ]
+
+        self._form_cache.set(cache_key, questions)
+        return questions
+
+    def _submit_get_form(self, form_id: str):
+        """
+        Fetch a form on a worker thread.
+
+        Lets callers that need both the form and its responses overlap the
+        two independent round-trips instead of paying them back to back.
+
+        Returns:
+            A Future resolving to the Form
+        """
+
+        def fetch() -> Form:
+            self._ensure_worker_http()
+            return self.get_form(form_id)
+
+        return self._executor().submit(fetch)
 
     def list_responses(
         self,
         form_id: str,
-        page_size: int = 100,
+        page_size: int = 5000,
     ) -> ResponseSummary:
         """
         List all responses to a form.
 
+        Every page is fetched regardless of page_size, so the default is
+        the API maximum to keep the round-trip count minimal.
+
         Args:
             form_id: The form ID
             page_size: Number of responses per page (max 5000)
@@ -52,44 +188,94 @@ class FormsClient:
         Returns:
             ResponseSummary with total count and list of responses
         """
-        responses = []
+        # All pages are fetched regardless of page_size, so the listing
+        # is cached by form alone; per-question callers hit memory
+        cached = self._responses_cache.get(form_id)
+        if cached is not None:
+            return cached
+
+        responses = list(self.iter_responses(form_id, page_size=page_size))
+
+        summary = ResponseSummary(
+            form_id=form_id,
+            total_responses=len(responses),
+            responses=responses,
+        )
+        self._responses_cache.set(form_id, summary)
+        return summary
+
+    def iter_responses(
+        self,
+        form_id: str,
+        limit: Optional[int] = None,
+        page_size: int = 100,
+    ):
+        """
+        Iterate responses lazily, stopping pagination at limit.
+
+        Unlike list_responses, this never fetches pages past what the
+        caller consumes, so asking for 100 responses from a 10k-response
+        form costs one page instead of all of them.
+
+        Args:
+            form_id: The form ID
+            limit: Stop after this many responses (None for all)
+            page_size: Responses to request per page
+
+        Yields:
+            FormResponse objects in API order
+        """
+        if limit is not None:
+            page_size = min(page_size, limit)
+
+        yielded = 0
+        for page in self._iter_response_pages(form_id, page_size):
+            for response_data in page.get("responses", []):
+                yield FormResponse.from_api_response(response_data)
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+    def _iter_response_pages(self, form_id: str, page_size: int = 5000):
+        """
+        Yield raw response-list pages, following pagination.
+
+        Yields the page dicts as returned by the API so aggregating
+        callers can work page by page without materializing every
+        response as a dataclass first.
+        """
         page_token = None
+        effective_page_size = min(page_size, 5000)
 
         while True:
             try:
-                request = self.service.forms().responses().list(
-                    formId=form_id,
-                    pageSize=min(page_size, 5000),
-                )
+                params = {"formId": form_id, "pageSize": effective_page_size}
                 if page_token:
-                    request = self.service.forms().responses().list(
-                        formId=form_id,
-                        pageSize=min(page_size, 5000),
-                        pageToken=page_token,
-                    )
+                    params["pageToken"] = page_token
 
-                result = request.execute()
+                result = (
+                    self.service.forms()
+                    .responses()
+                    .list(**params)
+                    .execute(http=self._thread_http())
+                )
             except Exception as e:
                 logger.error(f"Failed to list responses for {form_id}: {e}")
                 raise
 
-            for response_data in result.get("responses", []):
-                responses.append(FormResponse.from_api_response(response_data))
+            yield result
 
             page_token = result.get("nextPageToken")
             if not page_token:
                 break
 
-        return ResponseSummary(
-            form_id=form_id,
-            total_responses=len(responses),
-            responses=responses,
-        )
-
     def get_response(self, form_id: str, response_id: str) -> FormResponse:
         """
         Get a specific response by ID.
 
+        This is a single responses().get() round-trip; the form structure
+        is never fetched, since answers are keyed by question ID.
+
         Args:
             form_id: The form ID
             response_id: The response ID
@@ -102,7 +288,7 @@ class FormsClient:
                 self.service.forms()
                 .responses()
                 .get(formId=form_id, responseId=response_id)
-                .execute()
+                .execute(http=self._thread_http())
             )
         except Exception as e:
             logger.error(f"Failed to get response {response_id}: {e}")
@@ -124,31 +310,37 @@ class FormsClient:
         Returns:
             List of row dicts with question titles as keys
         """
-        # Get form to map question IDs to titles
-        form = self.get_form(form_id)
-        question_map = {q.question_id: q.title for q in form.questions}
-
-        # Get responses
-        summary = self.list_responses(form_id, page_size=limit)
+        # Fetch form structure and responses concurrently; the two calls
+        # are independent round-trips. Pagination stops at limit rather
+        # than fetching every response and slicing.
+        form_future = self._submit_get_form(form_id)
+        responses = self.iter_responses(form_id, limit=limit)
+        first = next(responses, None)  # Pull page one while the form fetch runs
+        form = form_future.result()
+
+        # Project each row through a prebuilt (title, question_id) list
+        # instead of re-walking the answers dict per response; every row
+        # gets the same columns, with "" for unanswered questions
+        projection = [(q.title, q.question_id) for q in form.questions]
+        join = ", ".join
+
+        def flatten(answer: Optional[Answer]) -> str:
+            if answer is None:
+                return ""
+            values = answer.text_answers or answer.file_urls
+            return join(values) if values else ""
 
         rows = []
-        for response in summary.responses[:limit]:
+        for response in chain([first] if first else [], responses):
+            answers_get = response.answers.get
             row = {
                 "_response_id": response.response_id,
-                "_submitted_at": response.last_submitted_time.isoformat(),
+                "_submitted_at": _fast_isoformat(response.last_submitted_time),
                 "_email": response.respondent_email or "",
             }
-
-            for question_id, answer in response.answers.items():
-                title = question_map.get(question_id, question_id)
-                # Combine text answers into single string
-                if answer.text_answers:
-                    row[title] = ", ".join(answer.text_answers)
-                elif answer.file_upload_answers:
-                    row[title] = ", ".join(answer.file_upload_answers)
-                else:
-                    row[title] = ""
-
+            row.update(
+                (title, flatten(answers_get(qid))) for title, qid in projection
+            )
             rows.append(row)
 
         return rows
@@ -157,6 +349,9 @@ class FormsClient:
         """
         Get list of question titles from a form.
 
+        Served from the form-structure cache, so calling this alongside
+        get_form or the summary helpers costs no extra API round-trip.
+
         Args:
             form_id: The form ID
 
@@ -180,14 +375,54 @@ class FormsClient:
             - last_response: datetime ISO string or None
             - question_stats: dict mapping question title to answer stats
         """
-        # Get form structure for question titles and types
-        form = self.get_form(form_id)
-        question_map = {q.question_id: q for q in form.questions}
+        # Fetch form structure concurrently with the first response page;
+        # the two calls are independent round-trips
+        form_future = self._submit_get_form(form_id)
+        pages = self._iter_response_pages(form_id)
+        first_page = next(pages, None)
+        form = form_future.result()
+
+        choice_qids = {
+            q.question_id
+            for q in form.questions
+            if q.question_type in ("CHOICE", "CHECKBOX", "DROPDOWN")
+        }
 
-        # Get all responses
-        summary = self.list_responses(form_id)
+        # Aggregate page by page instead of materializing every response
+        # as a dataclass and rescanning the full list per question
+        total_responses = 0
+        first_response: Optional[datetime] = None
+        last_response: Optional[datetime] = None
+        answer_counts: Counter[str] = Counter()
+        distributions: dict[str, Counter] = {qid: Counter() for qid in choice_qids}
 
-        if summary.total_responses == 0:
+        for page in chain([first_page] if first_page else [], pages):
+            for response in page.get("responses", []):
+                total_responses += 1
+
+                ts = FormResponse._parse_timestamp(
+                    response.get("lastSubmittedTime", "")
+                )
+                if first_response is None or ts < first_response:
+                    first_response = ts
+                if last_response is None or ts > last_response:
+                    last_response = ts
+
+                for qid, answer_data in response.get("answers", {}).items():
+                    values = [
+                        answer["value"]
+                        for answer in answer_data.get("textAnswers", {}).get(
+                            "answers", []
+                        )
+                        if answer.get("value")
+                    ]
+                    if not values:
+                        continue
+                    answer_counts[qid] += len(values)
+                    if qid in choice_qids:
+                        distributions[qid].update(values)
+
+        if total_responses == 0:
             return {
                 "total_responses": 0,
                 "first_response": None,
@@ -195,44 +430,19 @@ class FormsClient:
                 "question_stats": {},
             }
 
-        # Calculate date range
-        timestamps = [r.last_submitted_time for r in summary.responses]
-        first_response = min(timestamps)
-        last_response = max(timestamps)
-
-        # Calculate question stats
         question_stats = {}
         for question in form.questions:
             qid = question.question_id
-            title = question.title
-            qtype = question.question_type
-
-            # Count answers for this question
-            answers = []
-            for response in summary.responses:
-                if qid in response.answers:
-                    answer = response.answers[qid]
-                    answers.extend(answer.text_answers)
-
-            if qtype in ("CHOICE", "CHECKBOX", "DROPDOWN"):
-                # Distribution for choice questions
-                distribution = {}
-                for answer_val in answers:
-                    distribution[answer_val] = distribution.get(answer_val, 0) + 1
-                question_stats[title] = {
-                    "type": qtype,
-                    "total_answers": len(answers),
-                    "distribution": distribution,
-                }
-            else:
-                # Just count for text/other questions
-                question_stats[title] = {
-                    "type": qtype,
-                    "total_answers": len(answers),
-                }
+            stats = {
+                "type": question.question_type,
+                "total_answers": answer_counts.get(qid, 0),
+            }
+            if qid in choice_qids:
+                stats["distribution"] = dict(distributions[qid])
+            question_stats[question.title] = stats
 
         return {
-            "total_responses": summary.total_responses,
+            "total_responses": total_responses,
             "first_response": first_response.isoformat(),
             "last_response": last_response.isoformat(),
             "question_stats": question_stats,
@@ -242,6 +452,7 @@ class FormsClient:
         self,
         form_id: str,
         question_id: str,
+        limit: Optional[int] = None,
     ) -> dict[str, int]:
         """
         Get answer distribution for a specific question.
@@ -251,17 +462,47 @@ class FormsClient:
         Args:
             form_id: The form ID
             question_id: The question ID
+            limit: Only consider the first N responses (None for all;
+                a limit stops pagination early instead of fetching
+                every page)
 
         Returns:
             Dict mapping answer value to count
         """
+        if limit is not None:
+            responses = self.iter_responses(form_id, limit=limit)
+        else:
+            responses = self.list_responses(form_id).responses
+
+        distribution: Counter[str] = Counter()
+        for response in responses:
+            answer = response.answers.get(question_id)
+            if answer:
+                distribution.update(answer.text_answers)
+
+        return dict(distribution)
+
+    def get_all_distributions(self, form_id: str) -> dict[str, dict[str, int]]:
+        """
+        Get answer distributions for every question in one pass.
+
+        Scans the responses once instead of once per question, so a
+        dashboard rendering all questions makes a single fetch.
+
+        Args:
+            form_id: The form ID
+
+        Returns:
+            Dict mapping question ID to its answer-value counts
+        """
         summary = self.list_responses(form_id)
 
-        distribution: dict[str, int] = {}
+        distributions: dict[str, Counter] = {}
         for response in summary.responses:
-            if question_id in response.answers:
-                answer = response.answers[question_id]
-                for answer_val in answer.text_answers:
-                    distribution[answer_val] = distribution.get(answer_val, 0) + 1
+            for question_id, answer in response.answers.items():
+                dist = distributions.get(question_id)
+                if dist is None:
+                    dist = distributions[question_id] = Counter()
+                dist.update(answer.text_answers)
 
-        return distribution
+        return {qid: dict(dist) for qid, dist in distributions.items()}
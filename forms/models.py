@@ -1,10 +1,81 @@
 """Data models for Google Forms API."""
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Optional, Any
 
-
-@dataclass
+# C-level field extraction for the per-option hot loop below
+_GET_VALUE = itemgetter("value")
+
+
+def _parse_text_question(question: dict) -> tuple[str, list[str]]:
+    if question["textQuestion"].get("paragraph", False):
+        return "PARAGRAPH", []
+    return "TEXT", []
+
+
+def _parse_choice_question(question: dict) -> tuple[str, list[str]]:
+    choice_q = question["choiceQuestion"]
+    choice_type = choice_q.get("type", "RADIO")
+    opts = choice_q.get("options", ())
+    try:
+        options = [v or "" for v in map(_GET_VALUE, opts)]
+    except KeyError:
+        # "Other" options carry no value field; fall back to the
+        # per-option .get for the rare form that uses them
+        options = [opt.get("value", "") for opt in opts]
+
+    if choice_type == "CHECKBOX":
+        return "CHECKBOX", options
+    elif choice_type == "DROP_DOWN":
+        return "DROPDOWN", options
+    return "CHOICE", options
+
+
+def _parse_scale_question(question: dict) -> tuple[str, list[str]]:
+    scale_q = question["scaleQuestion"]
+    low = scale_q.get("low", 1)
+    high = scale_q.get("high", 5)
+    return "SCALE", [f"{low}-{high}"]
+
+
+# Shared empty dict for .get defaults on absent one-of fields
+_EMPTY: dict = {}
+
+# Sentinel for missing/unparseable timestamps. A constant keeps parsing
+# deterministic and avoids a clock syscall per bad value; epoch sorts
+# before any real submission time.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _fast_isoformat(dt: datetime) -> str:
+    """
+    ISO-format a parsed response timestamp.
+
+    The fixed f-string skips isoformat()'s microsecond/offset branching
+    for the common whole-second UTC case; anything else falls back.
+    """
+    if dt.tzinfo is not timezone.utc or dt.microsecond:
+        return dt.isoformat()
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}+00:00"
+    )
+
+
+# Maps the API's one-of question key to its parser. A single set
+# intersection replaces the chain of "in question" checks per item.
+_QUESTION_TYPE_DISPATCH = {
+    "textQuestion": _parse_text_question,
+    "choiceQuestion": _parse_choice_question,
+    "scaleQuestion": _parse_scale_question,
+    "dateQuestion": lambda question: ("DATE", []),
+    "timeQuestion": lambda question: ("TIME", []),
+    "fileUploadQuestion": lambda question: ("FILE_UPLOAD", []),
+    "rowQuestion": lambda question: ("GRID", []),
+}
+
+
+@dataclass(slots=True)
 class Question:
     """A question in a form."""
     question_id: str
@@ -15,15 +86,15 @@ class Question:
     options: list[str] = field(default_factory=list)
 
     @classmethod
-    def from_api_response(cls, item: dict) -> Optional["Question"]:
-        """Parse from Forms API item response."""
-        # Items can be questions, page breaks, images, etc.
-        # Only process question items
-        question_item = item.get("questionItem")
-        if not question_item:
-            return None
-
-        question = question_item.get("question", {})
+    def from_api_response(cls, item: dict) -> "Question":
+        """
+        Parse from Forms API item response.
+
+        Callers must pre-filter to items with a questionItem (forms also
+        contain page breaks, images, etc.); hoisting that check into the
+        caller's loop skips the call entirely for non-question items.
+        """
+        question = item["questionItem"].get("question", {})
         question_id = question.get("questionId", "")
 
         # Get question type and options
@@ -41,47 +112,12 @@ class Question:
     @staticmethod
     def _parse_question_type(question: dict) -> tuple[str, list[str]]:
         """Determine question type and extract options."""
-        options = []
-
-        if "textQuestion" in question:
-            text_q = question["textQuestion"]
-            if text_q.get("paragraph", False):
-                return "PARAGRAPH", []
-            return "TEXT", []
-
-        if "choiceQuestion" in question:
-            choice_q = question["choiceQuestion"]
-            choice_type = choice_q.get("type", "RADIO")
-            options = [opt.get("value", "") for opt in choice_q.get("options", [])]
-
-            if choice_type == "CHECKBOX":
-                return "CHECKBOX", options
-            elif choice_type == "DROP_DOWN":
-                return "DROPDOWN", options
-            return "CHOICE", options
-
-        if "scaleQuestion" in question:
-            scale_q = question["scaleQuestion"]
-            low = scale_q.get("low", 1)
-            high = scale_q.get("high", 5)
-            return "SCALE", [f"{low}-{high}"]
-
-        if "dateQuestion" in question:
-            return "DATE", []
-
-        if "timeQuestion" in question:
-            return "TIME", []
-
-        if "fileUploadQuestion" in question:
-            return "FILE_UPLOAD", []
-
-        if "rowQuestion" in question:
-            return "GRID", []
-
+        for key in _QUESTION_TYPE_DISPATCH.keys() & question.keys():
+            return _QUESTION_TYPE_DISPATCH[key](question)
         return "UNKNOWN", []
 
 
-@dataclass
+@dataclass(slots=True)
 class Form:
     """A Google Form."""
     form_id: str
@@ -96,12 +132,13 @@ class Form:
         """Parse from Forms API response."""
         info = data.get("info", {})
 
-        # Parse questions from items
-        questions = []
-        for item in data.get("items", []):
-            question = Question.from_api_response(item)
-            if question:
-                questions.append(question)
+        # Only question items parse; filtering here avoids a method call
+        # per page break / image / section header
+        questions = [
+            Question.from_api_response(item)
+            for item in data.get("items", ())
+            if "questionItem" in item
+        ]
 
         return cls(
             form_id=data.get("formId", ""),
@@ -113,41 +150,58 @@ class Form:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Answer:
-    """An answer to a question."""
-    question_id: str
+    """
+    An answer to a question.
+
+    The question ID lives in the FormResponse.answers key rather than
+    being duplicated on every instance. file_upload_answers holds raw
+    Drive file IDs; use file_urls for shareable links.
+    """
     text_answers: list[str] = field(default_factory=list)
     file_upload_answers: list[str] = field(default_factory=list)
 
+    @property
+    def file_urls(self) -> list[str]:
+        """Drive URLs for the uploaded files, built only when asked for."""
+        return [
+            f"https://drive.google.com/file/d/{file_id}"
+            for file_id in self.file_upload_answers
+        ]
+
     @classmethod
-    def from_api_response(cls, question_id: str, data: dict) -> "Answer":
+    def from_api_response(cls, data: dict) -> "Answer":
         """Parse from Forms API answer response."""
-        text_answers = []
-        file_answers = []
-
-        # Text answers (includes choice selections)
-        text_data = data.get("textAnswers", {})
-        for answer in text_data.get("answers", []):
-            value = answer.get("value", "")
-            if value:
-                text_answers.append(value)
-
-        # File upload answers
-        file_data = data.get("fileUploadAnswers", {})
-        for answer in file_data.get("answers", []):
-            file_id = answer.get("fileId", "")
-            if file_id:
-                file_answers.append(f"https://drive.google.com/file/d/{file_id}")
+        # Tuple defaults avoid allocating throwaway dicts/lists for the
+        # common case where one of the answer kinds is absent
+        text_answers = [
+            value
+            for answer in data.get("textAnswers", _EMPTY).get("answers", ())
+            if (value := answer.get("value"))
+        ]
+
+        # Keep raw file IDs; URLs are materialized lazily via file_urls
+        file_answers = [
+            file_id
+            for answer in data.get("fileUploadAnswers", _EMPTY).get("answers", ())
+            if (file_id := answer.get("fileId"))
+        ]
 
         return cls(
-            question_id=question_id,
             text_answers=text_answers,
             file_upload_answers=file_answers,
         )
 
+    def to_wire(self) -> dict:
+        """Shape for tool output; file IDs become Drive URLs here."""
+        return {
+            "text_answers": self.text_answers,
+            "file_upload_answers": self.file_urls,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class FormResponse:
     """A response to a form."""
     response_id: str
@@ -164,9 +218,10 @@ class FormResponse:
         last_submitted = cls._parse_timestamp(data.get("lastSubmittedTime", ""))
 
         # Parse answers
-        answers = {}
-        for question_id, answer_data in data.get("answers", {}).items():
-            answers[question_id] = Answer.from_api_response(question_id, answer_data)
+        answers = {
+            question_id: Answer.from_api_response(answer_data)
+            for question_id, answer_data in data.get("answers", {}).items()
+        }
 
         return cls(
             response_id=data.get("responseId", ""),
@@ -178,19 +233,36 @@ class FormResponse:
 
     @staticmethod
     def _parse_timestamp(ts: str) -> datetime:
-        """Parse ISO timestamp from API."""
+        """Parse ISO timestamp from API. Missing/bad values map to epoch."""
         if not ts:
-            return datetime.now()
-        # Handle Z suffix
-        if ts.endswith("Z"):
-            ts = ts.replace("Z", "+00:00")
+            return _EPOCH
+
+        # Google timestamps have a fixed RFC3339 layout ending in Z:
+        # YYYY-MM-DDTHH:MM:SS[.ffffff]Z. Slicing the digits out directly
+        # skips the Z-suffix string rebuild and fromisoformat's general
+        # format scan on the happy path.
         try:
+            if ts[-1] == "Z":
+                microsecond = 0
+                if len(ts) > 20 and ts[19] == ".":
+                    frac = ts[20:-1][:6]
+                    microsecond = int(frac) * 10 ** (6 - len(frac))
+                return datetime(
+                    int(ts[0:4]),
+                    int(ts[5:7]),
+                    int(ts[8:10]),
+                    int(ts[11:13]),
+                    int(ts[14:16]),
+                    int(ts[17:19]),
+                    microsecond,
+                    tzinfo=timezone.utc,
+                )
             return datetime.fromisoformat(ts)
         except ValueError:
-            return datetime.now()
+            return _EPOCH
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseSummary:
     """Summary of form responses."""
     form_id: str
@@ -1,13 +1,16 @@
 """Forms MCP Server - Google Forms operations via Model Context Protocol."""
 import os
-from typing import Optional
+from functools import cache
+from itertools import islice
 
 from mcp.server.fastmcp import FastMCP
 from googleapiclient.discovery import build
 
 from shared.auth import GoogleAuth, FORMS_SCOPES
+from shared.json_model import FastJsonModel
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import FormsClient
+from .models import _fast_isoformat
 
 # Initialize the MCP server
 mcp = FastMCP("forms")
@@ -15,27 +18,23 @@ mcp = FastMCP("forms")
 # App name can be overridden via environment
 APP_NAME = os.environ.get("GOOGLE_MCP_APP_NAME", "letter-rip")
 
-# Cached instances
-_paths: Optional[MCPPaths] = None
-_forms_client: Optional[FormsClient] = None
-
 
+@cache
 def get_paths() -> MCPPaths:
     """Get or create paths instance."""
-    global _paths
-    if _paths is None:
-        _paths = MCPPaths(APP_NAME)
-        ensure_data_dirs(_paths.data_dir)
-    return _paths
+    paths = MCPPaths(APP_NAME)
+    ensure_data_dirs(paths.data_dir)
+    return paths
 
 
+@cache
 def get_forms_client() -> FormsClient:
-    """Get or create authenticated Forms client."""
-    global _forms_client
-
-    if _forms_client is not None:
-        return _forms_client
+    """
+    Get or create authenticated Forms client.
 
+    functools.cache memoizes the built client; a failed build (e.g.
+    missing token) is not cached and is retried on the next call.
+    """
     paths = get_paths()
 
     if not paths.forms_token.exists():
@@ -51,11 +50,25 @@ def get_forms_client() -> FormsClient:
     )
 
     creds = auth.get_credentials()
-    service = build("forms", "v1", credentials=creds)
-    client = FormsClient(service=service)
 
-    _forms_client = client
-    return _forms_client
+    # Share one keep-alive transport across all tool calls instead of
+    # letting build() manage its own
+    import httplib2
+    import google_auth_httplib2
+
+    authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+
+    # Response pages for large forms are sizable; decode them with
+    # orjson when it's installed
+    service = build(
+        "forms",
+        "v1",
+        http=authed_http,
+        model=FastJsonModel(),
+        static_discovery=True,  # Use the packaged discovery doc; no HTTP fetch
+        cache_discovery=False,
+    )
+    return FormsClient(service=service)
 
 
 # =============================================================================
@@ -112,7 +125,7 @@ def list_questions(form_id: str) -> list[dict]:
         List of questions with id, title, type, required flag, and options.
     """
     client = get_forms_client()
-    form = client.get_form(form_id)
+    questions = client.list_questions(form_id)
 
     return [
         {
@@ -122,7 +135,7 @@ def list_questions(form_id: str) -> list[dict]:
             "required": q.required,
             "options": q.options,
         }
-        for q in form.questions
+        for q in questions
     ]
 
 
@@ -151,17 +164,11 @@ def get_responses(
         "responses": [
             {
                 "response_id": r.response_id,
-                "submitted_at": r.last_submitted_time.isoformat(),
+                "submitted_at": _fast_isoformat(r.last_submitted_time),
                 "email": r.respondent_email,
-                "answers": {
-                    qid: {
-                        "text_answers": a.text_answers,
-                        "file_upload_answers": a.file_upload_answers,
-                    }
-                    for qid, a in r.answers.items()
-                },
+                "answers": {qid: a.to_wire() for qid, a in r.answers.items()},
             }
-            for r in summary.responses[:limit]
+            for r in islice(summary.responses, limit)
         ],
     }
 
@@ -206,15 +213,9 @@ def get_response(form_id: str, response_id: str) -> dict:
 
     return {
         "response_id": response.response_id,
-        "submitted_at": response.last_submitted_time.isoformat(),
+        "submitted_at": _fast_isoformat(response.last_submitted_time),
         "email": response.respondent_email,
-        "answers": {
-            qid: {
-                "text_answers": a.text_answers,
-                "file_upload_answers": a.file_upload_answers,
-            }
-            for qid, a in response.answers.items()
-        },
+        "answers": {qid: a.to_wire() for qid, a in response.answers.items()},
     }
 
 
@@ -1,5 +1,6 @@
 """Entry point for Gmail MCP server."""
-from .server import mcp
+from .server import mcp, warm_up
 
 if __name__ == "__main__":
+    warm_up()
     mcp.run()
@@ -1,11 +1,73 @@
 """Gmail API client wrapper."""
 import base64
+import binascii
+import json
 import logging
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Optional
 
+from shared.cache import TTLCache
+from shared.email_cache import EmailCache
+
 logger = logging.getLogger("gmail_mcp.client")
 
+# Shared empty dict for .get defaults on absent nested fields
+_EMPTY: dict = {}
+
+# urlsafe alphabet -> standard alphabet, applied as one C-level translate
+_B64_TRANS = bytes.maketrans(b"-_", b"+/")
+
+
+def _decode_body(data: str) -> str:
+    """Decode a base64url body to text.
+
+    base64.urlsafe_b64decode wraps the C decoder in a Python-level
+    character replace; translating with a cached table and calling
+    binascii directly makes one pass over large bodies instead of two.
+    Gmail omits padding, so it's restored before decoding.
+    """
+    raw = data.encode("ascii").translate(_B64_TRANS)
+    if len(raw) % 4:
+        raw += b"=" * (4 - len(raw) % 4)
+    return binascii.a2b_base64(raw).decode("utf-8", "replace")
+
+
+# Seconds to cache the user's label list; labels change rarely, and a
+# stale entry only costs one extra fetch via the 409 path
+_LABELS_TTL = 300.0
+
+# Seconds before the on-disk label-ID mapping must be re-verified
+# against the API; label IDs are stable, so a day is conservative
+_LABEL_IDS_FILE_TTL = 86400.0
+
+# Seconds before a persistently cached message's labels are considered
+# stale; bodies are immutable, so only labels are ever refreshed
+_CACHED_LABELS_TTL = 300.0
+
+# Documented cap on subrequests per Gmail batch HTTP request
+_BATCH_MAX_REQUESTS = 100
+
+# Partial-response masks: _parse_message only reads headers, snippet,
+# labels, thread ID, and text part bodies, so everything else (notably
+# attachment payload bytes) stays off the wire
+_MESSAGE_FIELDS = (
+    "id,threadId,snippet,labelIds,payload/headers,payload/mimeType,"
+    "payload/body/data,payload/parts(mimeType,body/data,parts)"
+)
+_LIST_FIELDS = "messages/id"
+
+# Documented cap on message IDs per batchModify request
+_BATCH_MODIFY_MAX_IDS = 1000
+
+# Worker threads for the per-message fallback path; each keeps its own
+# keep-alive transport (httplib2 is not thread-safe) and the modest size
+# stays inside Gmail's per-user rate limits
+_POOL_WORKERS = 8
+
 # Map: internal key -> Gmail label name
 LABELS = {
     "fyi": "FYI",
@@ -25,6 +87,18 @@ VALID_KEYS = list(LABELS.keys())
 GMAIL_NAMES = list(LABELS.values())
 
 
+# Every accepted spelling of every label, resolved to its internal key.
+# Keys and Gmail names map exactly, and a lowercased form with hyphens/
+# underscores collapsed to spaces catches the case/separator variants.
+_NORMALIZED_KEYS: dict[str, str] = {}
+for _key, _name in LABELS.items():
+    _NORMALIZED_KEYS[_key] = _key
+    _NORMALIZED_KEYS[_name] = _key
+    _NORMALIZED_KEYS[_key.lower().replace("-", " ").replace("_", " ")] = _key
+    _NORMALIZED_KEYS[_name.lower().replace("-", " ").replace("_", " ")] = _key
+del _key, _name
+
+
 def normalize_label(label: str) -> str | None:
     """
     Convert any label format to the internal key.
@@ -36,25 +110,11 @@ def normalize_label(label: str) -> str | None:
 
     Returns None if not recognized.
     """
-    # Already a valid key?
-    if label in LABELS:
-        return label
-
-    # Is it a Gmail label name?
-    if label in LABEL_KEYS:
-        return LABEL_KEYS[label]
-
-    # Try case-insensitive match on keys
-    label_lower = label.lower().replace("-", "_")
-    if label_lower in LABELS:
-        return label_lower
-
-    # Try case-insensitive match on Gmail names
-    for gmail_name, key in LABEL_KEYS.items():
-        if gmail_name.lower() == label.lower():
-            return key
-
-    return None
+    # Exact key or Gmail name first, then the collapsed lowercase form;
+    # both are O(1) lookups in the precomputed table
+    return _NORMALIZED_KEYS.get(label) or _NORMALIZED_KEYS.get(
+        label.lower().replace("-", " ").replace("_", " ")
+    )
 
 
 def get_gmail_name(key: str) -> str | None:
@@ -62,15 +122,16 @@ def get_gmail_name(key: str) -> str | None:
     return LABELS.get(key)
 
 
+# The label set is a module constant, so the exclusion query is too;
+# hyphenated names need quoting for Gmail's query parser
+_EXCLUDE_QUERY = " ".join(
+    f'-label:"{name}"' if "-" in name else f"-label:{name}" for name in GMAIL_NAMES
+)
+
+
 def get_exclude_query() -> str:
     """Get Gmail query string to exclude all labeled emails."""
-    parts = []
-    for name in GMAIL_NAMES:
-        if "-" in name:
-            parts.append(f'-label:"{name}"')
-        else:
-            parts.append(f"-label:{name}")
-    return " ".join(parts)
+    return _EXCLUDE_QUERY
 
 
 @dataclass
@@ -92,15 +153,55 @@ class GmailClient:
     # Expose label constants for external use
     LABELS = LABELS
 
-    def __init__(self, service):
+    def __init__(
+        self,
+        service,
+        email_cache: Optional[EmailCache] = None,
+        label_ids_path: Optional[Path] = None,
+    ):
         """
         Initialize with a Gmail API service instance.
 
         Args:
             service: A googleapiclient.discovery.Resource for Gmail API v1
+            email_cache: Optional persistent cache of parsed messages;
+                bodies are immutable, so repeat reads skip the network
+            label_ids_path: Optional JSON file persisting the label-ID
+                mapping so a fresh process can skip the startup
+                labels.list round trip
         """
         self.service = service
+        self._email_cache = email_cache
+        self._label_ids_path = label_ids_path
         self._label_ids: dict[str, str] = {}
+        self._classification_ids: Optional[list[str]] = None
+        self._labels_cache = TTLCache(maxsize=1, ttl=_LABELS_TTL)
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Persistent worker pool, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="gmail-io"
+            )
+        return self._pool
+
+    def _ensure_worker_http(self) -> None:
+        """
+        Give the current worker thread its own authorized transport.
+
+        httplib2 connections are not thread-safe, so each pool thread gets
+        a dedicated AuthorizedHttp sharing the service's credentials.
+        """
+        if getattr(self._local, "http", None) is None:
+            import httplib2
+            import google_auth_httplib2
+
+            creds = self.service._http.credentials
+            self._local.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http()
+            )
 
     def fetch_unprocessed_emails(
         self,
@@ -110,9 +211,40 @@ class GmailClient:
         sender: Optional[str] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
+        label_ids: Optional[list[str]] = None,
     ) -> list[Email]:
         """Fetch emails that don't have any classification labels.
 
+        See iter_unprocessed_emails for the argument semantics; this
+        simply materializes the generator for callers that want a list.
+        """
+        return list(
+            self.iter_unprocessed_emails(
+                max_results=max_results,
+                newer_than_days=newer_than_days,
+                domain=domain,
+                sender=sender,
+                after=after,
+                before=before,
+                label_ids=label_ids,
+            )
+        )
+
+    def iter_unprocessed_emails(
+        self,
+        max_results: int = 50,
+        newer_than_days: Optional[int] = None,
+        domain: Optional[str] = None,
+        sender: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        label_ids: Optional[list[str]] = None,
+    ):
+        """Yield emails that don't have any classification labels.
+
+        Emails are yielded as each fetch chunk completes, so callers can
+        process them mid-fetch without holding every body in memory.
+
         Args:
             max_results: Maximum number of emails to fetch
             newer_than_days: Only fetch emails from the last N days (None = no limit)
@@ -120,6 +252,9 @@ class GmailClient:
             sender: Filter to emails from a specific sender email address
             after: Only emails after this date (YYYY-MM-DD format)
             before: Only emails before this date (YYYY-MM-DD format)
+            label_ids: Additional label IDs the messages must all carry;
+                filtering server-side means non-matching messages never
+                cost a full get round trip
         """
         # Build query to exclude already-classified emails
         query = get_exclude_query()
@@ -146,44 +281,57 @@ class GmailClient:
                 .messages()
                 .list(
                     userId="me",
-                    labelIds=["INBOX"],
+                    labelIds=["INBOX", *(label_ids or ())],
                     q=query,
                     maxResults=max_results,
+                    fields=_LIST_FIELDS,
                 )
                 .execute()
             )
         except Exception as e:
             logger.error(f"Failed to list messages: {e}")
-            return []
+            return
 
-        messages = results.get("messages", [])
-        emails = []
+        yield from self._iter_messages(results.get("messages", []))
 
-        for msg in messages:
-            try:
-                full_msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format="full")
-                    .execute()
-                )
-                email = self._parse_message(full_msg)
-                emails.append(email)
-            except Exception as e:
-                logger.warning(f"Failed to fetch message {msg['id']}: {e}")
+    def get_email(self, email_id: str) -> Optional[Email]:
+        """Fetch a single email by ID.
 
-        return emails
+        Served from the persistent cache when possible; only labels can
+        change after delivery, so a stale hit refreshes them with a
+        metadata-only get instead of refetching the whole body.
+        """
+        cached = self._email_cache.get(email_id) if self._email_cache else None
+        if cached is not None:
+            fields, ts = cached
+            if time.time() - ts > _CACHED_LABELS_TTL:
+                try:
+                    result = (
+                        self.service.users()
+                        .messages()
+                        .get(
+                            userId="me", id=email_id, format="minimal",
+                            fields="labelIds",
+                        )
+                        .execute()
+                    )
+                    fields["labels"] = result.get("labelIds", [])
+                    self._email_cache.update_labels(email_id, fields["labels"])
+                except Exception as e:
+                    logger.warning(f"Failed to refresh labels for {email_id}: {e}")
+            return Email(**fields)
 
-    def get_email(self, email_id: str) -> Optional[Email]:
-        """Fetch a single email by ID."""
         try:
             full_msg = (
                 self.service.users()
                 .messages()
-                .get(userId="me", id=email_id, format="full")
+                .get(userId="me", id=email_id, format="full", fields=_MESSAGE_FIELDS)
                 .execute()
             )
-            return self._parse_message(full_msg)
+            email = self._parse_message(full_msg)
+            if self._email_cache is not None:
+                self._email_cache.set(email.id, asdict(email))
+            return email
         except Exception as e:
             logger.warning(f"Failed to fetch email {email_id}: {e}")
             return None
@@ -214,6 +362,42 @@ class GmailClient:
         ).execute()
         logger.debug(f"Applied label {label_key} to message {message_id}")
 
+    def apply_labels_bulk(self, message_ids: list[str], label_key: str) -> None:
+        """Apply a classification label to many messages at once.
+
+        Same semantics as apply_label — other classification labels are
+        removed and INBOX is preserved — but batchModify accepts up to
+        1000 IDs per request, so N messages cost one round trip per
+        thousand instead of one each.
+
+        Args:
+            message_ids: Gmail message IDs to label
+            label_key: Internal label key (e.g. "archive")
+        """
+        if not message_ids:
+            return
+
+        label_id = self._get_or_create_label_id(label_key)
+        if not label_id:
+            raise ValueError(f"Unknown label key: {label_key}")
+
+        all_classification_ids = self._get_all_classification_label_ids()
+        labels_to_remove = [lid for lid in all_classification_ids if lid != label_id]
+
+        body = {"addLabelIds": [label_id]}
+        if labels_to_remove:
+            body["removeLabelIds"] = labels_to_remove
+
+        for start in range(0, len(message_ids), _BATCH_MODIFY_MAX_IDS):
+            chunk = message_ids[start : start + _BATCH_MODIFY_MAX_IDS]
+            self.service.users().messages().batchModify(
+                userId="me",
+                body={"ids": chunk, **body},
+            ).execute()
+        logger.debug(
+            f"Applied label {label_key} to {len(message_ids)} messages in bulk"
+        )
+
     def remove_label(self, message_id: str, label_key: str) -> None:
         """Remove a classification label from a message."""
         label_id = self._get_or_create_label_id(label_key)
@@ -281,8 +465,47 @@ class GmailClient:
             logger.warning(f"Failed to list drafts: {e}")
             return []
 
+    def _load_label_ids(self) -> bool:
+        """Load the persisted label-ID mapping if it's complete and fresh."""
+        path = self._label_ids_path
+        if path is None:
+            return False
+        try:
+            if time.time() - path.stat().st_mtime > _LABEL_IDS_FILE_TTL:
+                return False
+            mapping = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return False
+        # Superset check, not proper-subset: a stale file with extra keys
+        # but a required one missing must also be rejected
+        if not (self.LABELS.keys() <= mapping.keys()):
+            return False
+        self._label_ids = {key: mapping[key] for key in self.LABELS}
+        return True
+
+    def _save_label_ids(self) -> None:
+        """Persist the resolved label-ID mapping for future processes."""
+        if self._label_ids_path is None:
+            return
+        try:
+            self._label_ids_path.parent.mkdir(parents=True, exist_ok=True)
+            self._label_ids_path.write_text(json.dumps(self._label_ids))
+        except OSError as e:
+            logger.warning(f"Failed to persist label IDs: {e}")
+
     def ensure_labels_exist(self) -> None:
-        """Create classification labels if they don't exist."""
+        """Create classification labels if they don't exist.
+
+        Fully populates the _label_ids map from one labels.list call, so
+        apply_label and friends never pay a cold-cache fetch afterwards.
+        A complete, recent on-disk mapping skips even that call.
+        """
+        if self._load_label_ids():
+            self._classification_ids = [
+                self._label_ids[key] for key in self.LABELS
+            ]
+            return
+
         existing = self._get_existing_labels()
 
         for key, name in self.LABELS.items():
@@ -291,13 +514,19 @@ class GmailClient:
             if label_id:
                 self._label_ids[key] = label_id
             else:
-                # Try to create it
+                # Try to create it (caches the ID on success)
                 created_id = self._create_label(name, key)
                 if created_id:
                     logger.info(f"Created label: {name}")
                 else:
                     logger.warning(f"Could not create label: {name}")
 
+        # The removal set apply_label needs is constant from here on
+        self._classification_ids = [
+            self._label_ids[key] for key in self.LABELS if key in self._label_ids
+        ]
+        self._save_label_ids()
+
     def list_sent_emails(self, to_address: str, max_results: int = 5) -> list[Email]:
         """Fetch sent emails to a specific address (for style sampling).
 
@@ -319,6 +548,7 @@ class GmailClient:
                     labelIds=["SENT"],
                     q=query,
                     maxResults=max_results,
+                    fields=_LIST_FIELDS,
                 )
                 .execute()
             )
@@ -326,58 +556,132 @@ class GmailClient:
             logger.error(f"Failed to search sent emails: {e}")
             return []
 
-        messages = results.get("messages", [])
-        emails = []
+        return self._fetch_messages(results.get("messages", []))
+
+    def _fetch_messages(self, messages: list[dict]) -> list[Email]:
+        """Fetch full messages for a page of list() results as a list."""
+        return list(self._iter_messages(messages))
+
+    def _iter_messages(self, messages: list[dict]):
+        """Fetch full messages for a page of list() results, lazily.
+
+        Uses batch HTTP requests so N gets ride one round trip per
+        _BATCH_MAX_REQUESTS instead of one each. If a whole batch fails
+        (e.g. the batch endpoint is unavailable), its messages are
+        refetched individually on the worker pool so the I/O waits still
+        overlap. Messages that fail to fetch are logged and skipped;
+        list order is preserved.
 
-        for msg in messages:
+        Yields:
+            Parsed Email objects, chunk by chunk, so callers can start
+            work before the whole listing has been fetched and only one
+            chunk of bodies is resident at a time.
+        """
+        if not messages:
+            return
+
+        parsed: dict[int, Email] = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Failed to fetch message in batch: {exception}")
+                return
+            email = self._parse_message(response)
+            if self._email_cache is not None:
+                self._email_cache.set(email.id, asdict(email))
+            parsed[int(request_id)] = email
+
+        def fetch_one(index_and_msg: tuple[int, dict]) -> None:
+            index, msg = index_and_msg
+            self._ensure_worker_http()
             try:
                 full_msg = (
                     self.service.users()
                     .messages()
-                    .get(userId="me", id=msg["id"], format="full")
-                    .execute()
+                    .get(userId="me", id=msg["id"], format="full", fields=_MESSAGE_FIELDS)
+                    .execute(http=self._local.http)
                 )
                 email = self._parse_message(full_msg)
-                emails.append(email)
+                if self._email_cache is not None:
+                    self._email_cache.set(email.id, asdict(email))
+                parsed[index] = email
             except Exception as e:
                 logger.warning(f"Failed to fetch message {msg['id']}: {e}")
 
-        return emails
+        users_messages = self.service.users().messages()
+        for start in range(0, len(messages), _BATCH_MAX_REQUESTS):
+            chunk = messages[start : start + _BATCH_MAX_REQUESTS]
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index, msg in enumerate(chunk, start):
+                batch.add(
+                    users_messages.get(
+                        userId="me", id=msg["id"], format="full",
+                        fields=_MESSAGE_FIELDS,
+                    ),
+                    request_id=str(index),
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning(
+                    f"Batch message fetch failed, retrying individually: {e}"
+                )
+                list(self._executor().map(fetch_one, enumerate(chunk, start)))
+
+            yield from (parsed.pop(index) for index in sorted(parsed))
 
     def _parse_message(self, msg: dict) -> Email:
         """Parse Gmail API message into Email dataclass."""
-        headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
+        # Only three headers are consumed; a single scan beats building a
+        # full dict over the 30-60 headers a typical message carries
+        sender = subject = ""
+        timestamp = None
+        for header in msg["payload"].get("headers", ()):
+            name = header["name"]
+            if name == "From":
+                sender = header["value"]
+            elif name == "Subject":
+                subject = header["value"]
+            elif name == "Date":
+                timestamp = header["value"]
 
         body = self._extract_body(msg["payload"])
 
         return Email(
             id=msg["id"],
             thread_id=msg.get("threadId", msg["id"]),
-            sender=headers.get("From", ""),
-            subject=headers.get("Subject", ""),
+            sender=sender,
+            subject=subject,
             snippet=msg.get("snippet", ""),
             body=body,
             labels=msg.get("labelIds", []),
-            timestamp=headers.get("Date"),
+            timestamp=timestamp,
         )
 
     def _extract_body(self, payload: dict) -> str:
-        """Extract plain text body from message payload (recursive)."""
-        if "body" in payload and payload["body"].get("data"):
-            return base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8")
-
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if part["mimeType"] == "text/plain":
-                    if part["body"].get("data"):
-                        return base64.urlsafe_b64decode(part["body"]["data"]).decode(
-                            "utf-8"
-                        )
-                elif "parts" in part:
-                    # Nested multipart
-                    body = self._extract_body(part)
-                    if body:
-                        return body
+        """Extract plain text body from message payload.
+
+        Walks the MIME tree with an explicit stack instead of recursing,
+        returning the first text part with data; deep multipart messages
+        cost no Python call frames, and malformed parts decode with
+        replacement rather than raising.
+        """
+        # A non-multipart message carries the body directly
+        body_data = payload.get("body", _EMPTY).get("data")
+        if body_data:
+            return _decode_body(body_data)
+
+        # Reversed pushes keep pop() visiting parts in document order, so
+        # the same text/plain part wins as with the old recursive walk
+        stack = list(reversed(payload.get("parts", ())))
+        while stack:
+            part = stack.pop()
+            if part.get("mimeType") == "text/plain":
+                data = part.get("body", _EMPTY).get("data")
+                if data:
+                    return _decode_body(data)
+            else:
+                stack.extend(reversed(part.get("parts", ())))
 
         return ""
 
@@ -409,9 +713,24 @@ class GmailClient:
         return existing.get(label_name)
 
     def _get_existing_labels(self) -> dict[str, str]:
-        """Get map of label name -> label ID."""
+        """Get map of label name -> label ID.
+
+        The listing is cached for _LABELS_TTL seconds; labels are
+        essentially static, and the helpers above otherwise re-fetch the
+        full list once per label per message in a batch.
+        """
+        cached = self._labels_cache.get("labels")
+        if cached is not None:
+            return cached
+
         results = self.service.users().labels().list(userId="me").execute()
-        return {label["name"]: label["id"] for label in results.get("labels", [])}
+        mapping = {label["name"]: label["id"] for label in results.get("labels", [])}
+        self._labels_cache.set("labels", mapping)
+        return mapping
+
+    def invalidate_labels_cache(self) -> None:
+        """Drop the cached label listing (e.g. after out-of-band changes)."""
+        self._labels_cache.pop("labels")
 
     def _find_existing_label(self, target_name: str, existing: dict[str, str]) -> str | None:
         """Find an existing label that matches target_name (exact or normalized).
@@ -450,9 +769,16 @@ class GmailClient:
                 self.service.users().labels().create(userId="me", body=label_body).execute()
             )
             label_id = result["id"]
+            # Keep the cached listing consistent with the new label
+            cached = self._labels_cache.get("labels")
+            if cached is not None:
+                cached[name] = label_id
         except HttpError as e:
             if e.resp.status == 409:
-                # Label already exists or conflicts - find its ID using normalized matching
+                # Label already exists or conflicts - find its ID using normalized
+                # matching. The conflicting label is missing from the cached
+                # listing (or create would not have been tried), so refetch.
+                self.invalidate_labels_cache()
                 existing = self._get_existing_labels()
                 logger.info(f"Label {name} got 409, searching existing labels")
 
@@ -469,10 +795,21 @@ class GmailClient:
         return label_id
 
     def _get_all_classification_label_ids(self) -> list[str]:
-        """Get all classification label IDs (for removing prior labels)."""
+        """Get all classification label IDs (for removing prior labels).
+
+        Returns the list precomputed by ensure_labels_exist when
+        available; only a client whose startup hook never ran falls back
+        to the find-or-create path.
+        """
+        if self._classification_ids is not None:
+            return self._classification_ids
+
         label_ids = []
         for key in self.LABELS.keys():
             label_id = self._get_or_create_label_id(key)
             if label_id:
                 label_ids.append(label_id)
+
+        if len(label_ids) == len(self.LABELS):
+            self._classification_ids = label_ids
         return label_ids
@@ -6,6 +6,8 @@ from typing import Optional
 from mcp.server.fastmcp import FastMCP
 
 from shared.auth import GoogleAuth, GMAIL_SCOPES
+from shared.email_cache import EmailCache
+from shared.json_model import FastJsonModel
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import (
     GmailClient,
@@ -59,8 +61,33 @@ def get_gmail_client() -> GmailClient:
         scopes=GMAIL_SCOPES,
     )
     creds = auth.get_credentials()
-    service = build("gmail", "v1", credentials=creds)
-    client = GmailClient(service=service)
+
+    # Share one keep-alive transport across all tool calls instead of
+    # letting build() manage its own
+    import httplib2
+    import google_auth_httplib2
+
+    authed_http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(timeout=30)
+    )
+    # Message payloads are JSON-heavy (headers array, base64 body);
+    # decode them with orjson when it's installed
+    service = build(
+        "gmail",
+        "v1",
+        http=authed_http,
+        model=FastJsonModel(),
+        static_discovery=True,  # Use the packaged discovery doc; no HTTP fetch
+        cache_discovery=False,
+    )
+    # Parsed messages persist across restarts; bodies are immutable
+    email_cache = EmailCache(paths.data_files_dir / "email_cache.db")
+    client = GmailClient(
+        service=service,
+        email_cache=email_cache,
+        # A fresh mapping on disk lets startup skip the labels.list call
+        label_ids_path=paths.data_files_dir / "label_ids.json",
+    )
 
     # Ensure classification labels exist in Gmail
     client.ensure_labels_exist()
@@ -69,6 +96,21 @@ def get_gmail_client() -> GmailClient:
     return _gmail_client
 
 
+def warm_up() -> None:
+    """
+    Build the authenticated client before the first tool call.
+
+    Credential refresh, service build, and label resolution otherwise
+    land on whichever tool is invoked first. Missing credentials are not
+    fatal here — the per-tool error message tells the user how to
+    authenticate.
+    """
+    try:
+        get_gmail_client()
+    except Exception as e:
+        print(f"[gmail-mcp] Client warm-up skipped: {e}", file=sys.stderr)
+
+
 # =============================================================================
 # EMAIL OPERATIONS
 # =============================================================================
@@ -84,7 +126,8 @@ def list_emails(
     Fetch emails with optional filters.
 
     Args:
-        labels: Filter by Gmail labels (e.g., ["INBOX", "UNREAD"])
+        labels: Filter by Gmail labels (e.g., ["INBOX", "UNREAD"]);
+            messages must carry all of them
         days: Only fetch emails from the last N days
         limit: Maximum number of emails to return
 
@@ -92,11 +135,18 @@ def list_emails(
         List of email summaries with id, sender, subject, snippet, timestamp
     """
     gmail = get_gmail_client()
-    emails = gmail.fetch_unprocessed_emails(max_results=limit, newer_than_days=days)
 
-    # Filter by labels if specified
+    # Resolve label names to IDs and filter server-side, so messages
+    # that would be discarded here are never fully fetched. System
+    # labels (INBOX, UNREAD, ...) are their own IDs.
+    label_ids = None
     if labels:
-        emails = [e for e in emails if any(label in e.labels for label in labels)]
+        existing = gmail._get_existing_labels()
+        label_ids = [existing.get(label, label) for label in labels]
+
+    emails = gmail.fetch_unprocessed_emails(
+        max_results=limit, newer_than_days=days, label_ids=label_ids
+    )
 
     return [
         {
@@ -222,6 +272,36 @@ def apply_label(email_id: str, label: str) -> dict:
     return _apply_label(email_id, label_key)
 
 
+@mcp.tool()
+def label_emails_bulk(email_ids: list[str], label: str) -> dict:
+    """
+    Apply a classification label to many emails in one call.
+
+    Prefer this over looping apply_label when classifying a batch —
+    it uses Gmail's batchModify endpoint, so the whole batch costs a
+    single API round trip.
+
+    Args:
+        email_ids: List of Gmail message IDs
+        label: The classification (fyi, respond, draft, archive, needs_review)
+
+    Returns:
+        Status with the count of labeled emails
+    """
+    label_key = normalize_label(label)
+    if not label_key:
+        raise ValueError(f"Invalid label: {label}. Valid: {VALID_KEYS} or {GMAIL_NAMES}")
+
+    gmail = get_gmail_client()
+    gmail.apply_labels_bulk(email_ids, label_key)
+
+    return {
+        "status": "applied",
+        "count": len(email_ids),
+        "label": get_gmail_name(label_key),
+    }
+
+
 @mcp.tool()
 def remove_label(email_id: str, label: str) -> dict:
     """
@@ -364,6 +444,8 @@ def main():
     print(f"[gmail-mcp] Using app name: {APP_NAME}", file=sys.stderr)
     print(f"[gmail-mcp] Labels: {VALID_KEYS}", file=sys.stderr)
 
+    warm_up()
+
     if args.transport == "http":
         mcp.run(transport="streamable-http")
     else:
@@ -1,12 +1,29 @@
 """Shared utilities for Google MCPs."""
-from .auth import GoogleAuth, GMAIL_SCOPES, SHEETS_SCOPES
-from .paths import MCPPaths, get_data_dir, ensure_data_dirs
-
-__all__ = [
-    "GoogleAuth",
-    "GMAIL_SCOPES",
-    "SHEETS_SCOPES",
-    "MCPPaths",
-    "get_data_dir",
-    "ensure_data_dirs",
-]
+from importlib import import_module
+from typing import Any
+
+# Re-exports resolve lazily (PEP 562). The calendar package imports this
+# package, and it shadows the stdlib "calendar" module that stdlib email
+# imports mid-initialization; eagerly pulling in .auth here would drag
+# google.auth, whose import needs email.message, into that cycle and
+# break `import email` for the whole process.
+_EXPORTS = {
+    "GoogleAuth": "auth",
+    "GMAIL_SCOPES": "auth",
+    "SHEETS_SCOPES": "auth",
+    "TTLCache": "cache",
+    "EmailCache": "email_cache",
+    "FastJsonModel": "json_model",
+    "MCPPaths": "paths",
+    "get_data_dir": "paths",
+    "ensure_data_dirs": "paths",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{submodule}", __name__), name)
@@ -1,11 +1,19 @@
 """Google OAuth authentication utilities."""
-import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+# google.auth.transport.requests and google_auth_oauthlib.flow are
+# imported lazily in the refresh/re-auth branches: with a valid cached
+# token (the common path) neither is touched, and skipping them trims
+# the import graph for every stdio invocation.
+
+# Delay before writing a refreshed token back to disk. Refreshes happen
+# on the API call path; deferring the write keeps disk I/O off it while
+# still persisting soon enough to survive a restart.
+_PERSIST_DELAY = 5.0
 
 # Scopes for different Google APIs
 GMAIL_SCOPES = [
@@ -47,9 +55,20 @@ class GoogleAuth:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.scopes = scopes
+        self._creds: Optional[Credentials] = None
+        self._persist_timer: Optional[threading.Timer] = None
 
     def get_credentials(self) -> Credentials:
-        """Get valid credentials, refreshing or re-authenticating as needed."""
+        """
+        Get valid credentials, refreshing or re-authenticating as needed.
+
+        The credentials object is cached in memory and reused across
+        calls, and mid-session refreshes persist the new token to disk
+        on a deferred timer instead of on the API call path.
+        """
+        if self._creds is not None:
+            return self._creds
+
         creds = None
 
         if self.token_path.exists():
@@ -60,6 +79,8 @@ class GoogleAuth:
 
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
+                from google.auth.transport.requests import Request
+
                 creds.refresh(Request())
             else:
                 if not self.credentials_path.exists():
@@ -68,6 +89,8 @@ class GoogleAuth:
                         "Download from Google Cloud Console."
                     )
 
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     str(self.credentials_path),
                     self.scopes
@@ -78,8 +101,43 @@ class GoogleAuth:
             self.token_path.parent.mkdir(parents=True, exist_ok=True)
             self.token_path.write_text(creds.to_json())
 
+        self._watch_refreshes(creds)
+        self._creds = creds
         return creds
 
+    def _watch_refreshes(self, creds: Credentials) -> None:
+        """Persist the token after mid-session refreshes, off the call path."""
+        original_refresh = creds.refresh
+
+        def refresh(request):
+            original_refresh(request)
+            self._schedule_persist(creds)
+
+        creds.refresh = refresh
+
+    def _schedule_persist(self, creds: Credentials) -> None:
+        """Write the token to disk shortly, coalescing rapid refreshes."""
+        if self._persist_timer is not None:
+            self._persist_timer.cancel()
+
+        timer = threading.Timer(_PERSIST_DELAY, self._persist, args=(creds,))
+        timer.daemon = True
+        timer.start()
+        self._persist_timer = timer
+
+    def _persist(self, creds: Credentials) -> None:
+        """Write the current token to disk."""
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        self.token_path.write_text(creds.to_json())
+
+    def flush(self) -> None:
+        """Persist any pending token write immediately (e.g. on shutdown)."""
+        if self._persist_timer is not None:
+            self._persist_timer.cancel()
+            self._persist_timer = None
+        if self._creds is not None:
+            self._persist(self._creds)
+
     def is_authenticated(self) -> bool:
         """Check if valid credentials exist."""
         if not self.token_path.exists():
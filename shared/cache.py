@@ -0,0 +1,175 @@
+"""Small in-memory TTL cache for API client wrappers."""
+import json
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a fixed TTL.
+
+    Entries are evicted lazily on access once they exceed the TTL, and
+    least-recently-used entries are dropped when the cache is full.
+
+    Usage:
+        cache = TTLCache(maxsize=256, ttl=120)
+        cache.set(("list_events", "primary"), events)
+        hit = cache.get(("list_events", "primary"))
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 120.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Time-to-live for entries, in seconds
+            timer: Clock function (injectable for tests)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if self._timer() >= expires_at:
+            del self._entries[key]
+            return default
+
+        # Mark as recently used
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value, evicting the least-recently-used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Per-entry TTL override in seconds (defaults to the
+                cache-wide TTL)
+        """
+        if key in self._entries:
+            del self._entries[key]
+        elif len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+
+        self._entries[key] = (self._timer() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        self._entries.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove all entries whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; truthy return removes the entry
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, default=_MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskTTLCache:
+    """
+    Single JSON value persisted to disk with a TTL.
+
+    Unlike TTLCache this survives process restarts, which suits data
+    that changes rarely but is refetched at every MCP startup (e.g. the
+    user's calendar list). All operations are best-effort: a missing,
+    expired or unreadable file is simply a miss, and a failed write
+    never raises.
+
+    Usage:
+        cache = DiskTTLCache(data_dir / "cache" / "calendar_list.json")
+        items = cache.load()
+        if items is None:
+            items = fetch()
+            cache.store(items)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 86400.0,
+        timer: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: File to persist the value in (parents created on store)
+            ttl: Time-to-live for the stored value, in seconds
+            timer: Clock function (injectable for tests)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._timer = timer
+
+    def load(self) -> Any:
+        """Return the cached value, or None if missing, expired or unreadable."""
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if self._timer() - payload["cached_at"] >= self.ttl:
+                return None
+            return payload["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, value: Any) -> None:
+        """
+        Persist a JSON-serializable value with the current timestamp.
+
+        Writes to a temp file and renames so a crash mid-write leaves
+        the previous value intact rather than a truncated file.
+        """
+        payload = {"cached_at": self._timer(), "value": value}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def invalidate(self) -> None:
+        """Remove the cached value if present."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+# Sentinel for __contains__ (None is a valid cached value)
+_MISSING = object()
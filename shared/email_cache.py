@@ -0,0 +1,106 @@
+"""Persistent on-disk cache for parsed Gmail messages.
+
+Message bodies are immutable once delivered, so refetching and reparsing
+them on every server restart is pure overhead. This sqlite-backed store
+keeps parsed Email fields keyed by message ID across processes; only the
+mutable labels field needs refreshing, which callers handle by checking
+the entry's age.
+
+Rows hold JSON rather than pickles so a corrupted or tampered cache file
+can't execute code on load.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+
+class EmailCache:
+    """Sqlite-backed cache of parsed email fields, LRU-bounded by row count."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        maxsize: int = 1000,
+        timer: Callable[[], float] = time.time,
+    ):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            db_path: Location of the sqlite file
+            maxsize: Maximum cached messages; oldest entries are evicted
+            timer: Clock used for entry timestamps (injectable for tests)
+        """
+        self.maxsize = maxsize
+        self._timer = timer
+        # One connection shared across threads, serialized by our own lock
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS emails "
+                "(id TEXT PRIMARY KEY, data TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, message_id: str) -> Optional[tuple[dict, float]]:
+        """
+        Look up a cached message.
+
+        Returns:
+            (fields, timestamp) if present, else None. The timestamp is
+            when the entry was stored; callers decide whether the mutable
+            labels field is fresh enough.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, ts FROM emails WHERE id = ?", (message_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0]), row[1]
+        except ValueError:
+            return None
+
+    def set(self, message_id: str, fields: dict) -> None:
+        """Store (or refresh) a message's parsed fields."""
+        data = json.dumps(fields)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO emails (id, data, ts) VALUES (?, ?, ?)",
+                (message_id, data, self._timer()),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def update_labels(self, message_id: str, labels: list[str]) -> None:
+        """Refresh just the labels of a cached message, bumping its age."""
+        cached = self.get(message_id)
+        if cached is None:
+            return
+        fields, _ = cached
+        fields["labels"] = labels
+        self.set(message_id, fields)
+
+    def pop(self, message_id: str) -> None:
+        """Drop a cached message if present."""
+        with self._lock:
+            self._conn.execute("DELETE FROM emails WHERE id = ?", (message_id,))
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        """Delete oldest rows beyond maxsize. Caller holds the lock."""
+        self._conn.execute(
+            "DELETE FROM emails WHERE id IN ("
+            "SELECT id FROM emails ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,35 @@
+"""Optional fast JSON decoding for googleapiclient services."""
+from googleapiclient.model import JsonModel
+
+try:
+    # Optional C decoder; 2-5x faster than stdlib json on large payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJsonModel(JsonModel):
+    """
+    JsonModel that decodes API responses with orjson when available.
+
+    Pass to build() as model=FastJsonModel() so the speedup stays scoped
+    to services that opt in instead of monkey-patching googleapiclient.
+    Falls back to the stdlib decoder when orjson is not installed.
+    """
+
+    def deserialize(self, content):
+        if orjson is None:
+            return JsonModel.deserialize(self, content)
+
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Mirror JsonModel: non-JSON bodies pass through as text
+            try:
+                return content.decode("utf-8")
+            except AttributeError:
+                return content
+
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
@@ -1,9 +1,24 @@
 """Path management for Google MCPs."""
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=None)
+def _resolve_data_dir(app_name: str, env_dir: Optional[str]) -> Path:
+    """Resolve the data directory for (app_name, env override).
+
+    Keyed on the environment value as well as the app name, so a changed
+    environment variable is never masked by a stale cache entry. Path.home()
+    stats the filesystem on some platforms; caching keeps it to one call
+    per distinct configuration.
+    """
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return Path.home() / f".{app_name}"
+
+
 def get_data_dir(app_name: str) -> Path:
     """
     Get the user data directory for an MCP application.
@@ -20,12 +35,13 @@ def get_data_dir(app_name: str) -> Path:
     """
     # Environment variable: LETTER_RIP_DATA_DIR
     env_var = app_name.upper().replace("-", "_") + "_DATA_DIR"
-    env_dir = os.environ.get(env_var)
-    if env_dir:
-        return Path(env_dir).expanduser()
+    return _resolve_data_dir(app_name, os.environ.get(env_var))
 
-    # Default: ~/.letter-rip/
-    return Path.home() / f".{app_name}"
+
+# Data dirs already ensured this process; repeat calls (one per tool
+# invocation in the servers) become a set lookup instead of five mkdir
+# stat syscalls
+_ensured: set[Path] = set()
 
 
 def ensure_data_dirs(data_dir: Path) -> None:
@@ -38,10 +54,16 @@ def ensure_data_dirs(data_dir: Path) -> None:
     - data/
     - logs/
     - versions/
+
+    Each directory tree is only checked once per process.
     """
+    if data_dir in _ensured:
+        return
+
     subdirs = ["config", "credentials", "data", "logs", "versions"]
     for subdir in subdirs:
         (data_dir / subdir).mkdir(parents=True, exist_ok=True)
+    _ensured.add(data_dir)
 
 
 class MCPPaths:
@@ -52,93 +74,97 @@ class MCPPaths:
         paths = MCPPaths("letter-rip")
         creds = paths.gmail_credentials
         token = paths.gmail_token
+
+    The layout never changes after construction, so every accessor is a
+    cached_property — each Path join is computed at most once per
+    instance instead of on every access.
     """
 
     def __init__(self, app_name: str, data_dir: Optional[Path] = None):
         self.app_name = app_name
         self._data_dir = data_dir or get_data_dir(app_name)
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
         """Root data directory."""
         return self._data_dir
 
-    @property
+    @cached_property
     def config_dir(self) -> Path:
         """Configuration files directory."""
         return self._data_dir / "config"
 
-    @property
+    @cached_property
     def credentials_dir(self) -> Path:
         """Credentials directory."""
         return self._data_dir / "credentials"
 
-    @property
+    @cached_property
     def data_files_dir(self) -> Path:
         """Data files directory."""
         return self._data_dir / "data"
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Logs directory."""
         return self._data_dir / "logs"
 
-    @property
+    @cached_property
     def versions_dir(self) -> Path:
         """Backup versions directory."""
         return self._data_dir / "versions"
 
     # Gmail-specific paths
-    @property
+    @cached_property
     def gmail_credentials(self) -> Path:
         """Gmail OAuth client credentials."""
         return self.credentials_dir / "gmail_credentials.json"
 
-    @property
+    @cached_property
     def gmail_token(self) -> Path:
         """Gmail OAuth token."""
         return self.credentials_dir / "token.json"
 
     # Sheets-specific paths
-    @property
+    @cached_property
     def sheets_credentials(self) -> Path:
         """Sheets OAuth client credentials (can share with Gmail)."""
-        return self.credentials_dir / "gmail_credentials.json"
+        return self.gmail_credentials
 
-    @property
+    @cached_property
     def sheets_token(self) -> Path:
         """Sheets OAuth token."""
         return self.credentials_dir / "sheets_token.json"
 
     # Calendar-specific paths
-    @property
+    @cached_property
     def calendar_credentials(self) -> Path:
         """Calendar OAuth client credentials (can share with Gmail)."""
-        return self.credentials_dir / "gmail_credentials.json"
+        return self.gmail_credentials
 
-    @property
+    @cached_property
     def calendar_token(self) -> Path:
         """Calendar OAuth token."""
         return self.credentials_dir / "calendar_token.json"
 
     # Slides-specific paths
-    @property
+    @cached_property
     def slides_credentials(self) -> Path:
         """Slides OAuth client credentials (can share with Gmail)."""
-        return self.credentials_dir / "gmail_credentials.json"
+        return self.gmail_credentials
 
-    @property
+    @cached_property
     def slides_token(self) -> Path:
         """Slides OAuth token."""
         return self.credentials_dir / "slides_token.json"
 
     # Forms-specific paths
-    @property
+    @cached_property
     def forms_credentials(self) -> Path:
         """Forms OAuth client credentials (can share with Gmail)."""
-        return self.credentials_dir / "gmail_credentials.json"
+        return self.gmail_credentials
 
-    @property
+    @cached_property
     def forms_token(self) -> Path:
         """Forms OAuth token."""
         return self.credentials_dir / "forms_token.json"
@@ -0,0 +1,63 @@
+"""Retry helper for Google API requests."""
+import logging
+import random
+import time
+
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger("google_mcps.retry")
+
+# Statuses worth retrying: rate limits and transient server errors
+RETRYABLE_STATUSES = (403, 429, 500, 503)
+
+
+def execute_with_retry(
+    request,
+    max_attempts: int = 6,
+    base: float = 0.5,
+    cap: float = 30.0,
+    http=None,
+):
+    """
+    Execute a googleapiclient request, retrying transient failures.
+
+    Rate-limit and server errors are retried with jittered exponential
+    backoff (honoring a Retry-After header when the API sends one);
+    anything else re-raises immediately.
+
+    Args:
+        request: A googleapiclient HttpRequest (not yet executed)
+        max_attempts: Total attempts before giving up
+        base: Initial backoff in seconds, doubled each attempt
+        cap: Maximum backoff in seconds
+        http: Optional HTTP transport override passed to execute()
+
+    Returns:
+        The parsed API response
+    """
+    for attempt in range(max_attempts):
+        try:
+            return request.execute(http=http)
+        except HttpError as e:
+            status = e.resp.status if e.resp is not None else None
+            if status not in RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+
+            delay = _retry_delay(e, attempt, base, cap)
+            logger.warning(
+                f"Transient {status} from API, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            time.sleep(delay)
+
+
+def _retry_delay(error: HttpError, attempt: int, base: float, cap: float) -> float:
+    """Backoff delay for an attempt, preferring the server's Retry-After."""
+    retry_after = error.resp.get("retry-after") if error.resp else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    return min(cap, base * 2 ** attempt) + random.uniform(0, 0.25)
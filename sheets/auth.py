@@ -3,12 +3,7 @@
 import argparse
 import os
 import sys
-from pathlib import Path
 
-# Add parent to path for shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from googleapiclient.discovery import build
 from shared.auth import GoogleAuth, SHEETS_SCOPES
 from shared.paths import MCPPaths, ensure_data_dirs
 
@@ -54,6 +49,10 @@ def main():
 
     if args.test:
         print(f"\nTesting with spreadsheet: {args.test}")
+        # Imported lazily: discovery pulls in a large dependency graph
+        # that only matters once credentials exist
+        from googleapiclient.discovery import build
+
         service = build("sheets", "v4", credentials=creds)
 
         try:
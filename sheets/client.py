@@ -1,12 +1,30 @@
 """Google Sheets API client wrapper."""
 from dataclasses import dataclass
+from itertools import zip_longest
 from typing import Optional, Any
 import logging
+import re
+
+from shared.cache import TTLCache
 
 logger = logging.getLogger("google_mcps.sheets")
 
+# Seconds to cache spreadsheet metadata and headers; structure changes
+# rarely within a session, and agents exploring a sheet ask for both
+# back to back
+_INFO_TTL = 300.0
+
+# Partial-response mask for spreadsheets().get: only the properties the
+# parser below reads. Without it the API returns every sheet's grid data
+# metadata, conditional formats, protected ranges, etc. — often megabytes
+# on large workbooks
+_SPREADSHEET_FIELDS = (
+    "spreadsheetId,properties(title,locale,timeZone),"
+    "sheets(properties(sheetId,title,gridProperties(rowCount,columnCount)))"
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class SheetInfo:
     """Information about a sheet (tab) in a spreadsheet."""
     sheet_id: int
@@ -15,7 +33,7 @@ class SheetInfo:
     column_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadsheetInfo:
     """Information about a spreadsheet."""
     spreadsheet_id: str
@@ -36,6 +54,14 @@ class SheetsClient:
             service: Google Sheets API service object
         """
         self.service = service
+        self._info_cache = TTLCache(maxsize=32, ttl=_INFO_TTL)
+
+    def refresh_info(self, spreadsheet_id: str, sheet_name: Optional[str] = None) -> None:
+        """Drop cached metadata (and optionally one sheet's headers and indexes)."""
+        self._info_cache.pop(spreadsheet_id)
+        if sheet_name is not None:
+            self._info_cache.pop(("headers", spreadsheet_id, sheet_name))
+            self._info_cache.pop(("index", spreadsheet_id, sheet_name))
 
     def get_spreadsheet_info(self, spreadsheet_id: str) -> SpreadsheetInfo:
         """
@@ -47,10 +73,14 @@ class SheetsClient:
         Returns:
             SpreadsheetInfo with title, sheets list, locale, timezone
         """
+        cached = self._info_cache.get(spreadsheet_id)
+        if cached is not None:
+            return cached
+
         try:
             result = (
                 self.service.spreadsheets()
-                .get(spreadsheetId=spreadsheet_id)
+                .get(spreadsheetId=spreadsheet_id, fields=_SPREADSHEET_FIELDS)
                 .execute()
             )
         except Exception as e:
@@ -69,34 +99,31 @@ class SheetsClient:
             ))
 
         props = result.get("properties", {})
-        return SpreadsheetInfo(
+        info = SpreadsheetInfo(
             spreadsheet_id=result.get("spreadsheetId", spreadsheet_id),
             title=props.get("title", ""),
             sheets=sheets,
             locale=props.get("locale"),
             time_zone=props.get("timeZone"),
         )
+        self._info_cache.set(spreadsheet_id, info)
+        return info
 
-    def list_sheets(self, spreadsheet_id: str) -> list[dict]:
+    def list_sheets(self, spreadsheet_id: str) -> list[SheetInfo]:
         """
         List all sheets (tabs) in a spreadsheet.
 
+        Returns the SheetInfo objects already held by the cached
+        metadata rather than copying them into dicts; serialization to
+        plain dicts happens once, at the MCP boundary.
+
         Args:
             spreadsheet_id: The spreadsheet ID
 
         Returns:
-            List of sheet info dicts with title, sheet_id, row_count, column_count
+            List of SheetInfo objects
         """
-        info = self.get_spreadsheet_info(spreadsheet_id)
-        return [
-            {
-                "title": sheet.title,
-                "sheet_id": sheet.sheet_id,
-                "row_count": sheet.row_count,
-                "column_count": sheet.column_count,
-            }
-            for sheet in info.sheets
-        ]
+        return self.get_spreadsheet_info(spreadsheet_id).sheets
 
     def get_headers(
         self,
@@ -113,6 +140,11 @@ class SheetsClient:
         Returns:
             List of header column names
         """
+        cache_key = ("headers", spreadsheet_id, sheet_name)
+        cached = self._info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         range_notation = f"'{sheet_name}'!1:1"
 
         try:
@@ -127,7 +159,9 @@ class SheetsClient:
             raise
 
         values = result.get("values", [[]])
-        return values[0] if values else []
+        headers = values[0] if values else []
+        self._info_cache.set(cache_key, headers)
+        return headers
 
     def read_sheet(
         self,
@@ -150,6 +184,138 @@ class SheetsClient:
         Returns:
             List of row dictionaries with column names as keys
         """
+        values = self._fetch_values(spreadsheet_id, sheet_name, range_notation)
+        if not values:
+            return []
+
+        return self._values_to_dicts(values, include_headers)
+
+    @staticmethod
+    def _values_to_dicts(
+        values: list[list],
+        include_headers: bool = True,
+        headers: Optional[list] = None,
+    ) -> list[dict]:
+        """Turn a raw values payload into a list of row dictionaries."""
+        if not values:
+            return []
+
+        if headers is not None:
+            data_rows = values
+        elif include_headers:
+            headers = values[0]
+            data_rows = values[1:]
+        else:
+            # Generate column names
+            max_cols = max(len(row) for row in values) if values else 0
+            headers = [f"column_{i}" for i in range(max_cols)]
+            data_rows = values
+
+        # Header-only payloads skip the row loop entirely
+        if not data_rows:
+            return []
+
+        # zip/zip_longest build each row dict in C; short rows pad with
+        # "" and long rows truncate to the header count, matching the
+        # old per-cell bounds check
+        n_headers = len(headers)
+        return [
+            dict(zip(headers, row))
+            if len(row) >= n_headers
+            else dict(zip_longest(headers, row, fillvalue=""))
+            for row in data_rows
+        ]
+
+    def read_sheet_columnar(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        range_notation: Optional[str] = None,
+    ) -> dict[str, list]:
+        """
+        Read a sheet as columns instead of rows.
+
+        One list per column rather than one dict per row: on large
+        sheets the per-row dict overhead dwarfs the cell data, and a
+        filter over a single column can scan one contiguous list. Row
+        dicts for selected indices can be rebuilt on demand with
+        {h: col[i] for h, col in columns.items()}.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet (tab)
+            range_notation: Optional A1 notation (e.g., "A2:E100")
+
+        Returns:
+            Dict mapping each header to that column's values, padded
+            with "" so every column has the same length
+        """
+        values = self._fetch_values(spreadsheet_id, sheet_name, range_notation)
+        if not values:
+            return {}
+
+        headers = values[0]
+        if len(values) == 1:
+            return {header: [] for header in headers}
+
+        # zip_longest(*rows) transposes in C, padding short rows with "";
+        # zip against headers drops any cells past the header count
+        columns = zip_longest(*values[1:], fillvalue="")
+        return {
+            header: list(column)
+            for header, column in zip(headers, columns)
+        }
+
+    def read_sheets_batch(
+        self,
+        spreadsheet_id: str,
+        ranges: list[tuple[str, Optional[str]]],
+    ) -> dict[str, list[dict]]:
+        """
+        Read several ranges of one spreadsheet in a single API call.
+
+        values().batchGet returns all requested ranges in one round
+        trip, so reading N tabs costs one HTTP request instead of N.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            ranges: List of (sheet_name, range_notation) pairs;
+                    range_notation may be None to read the whole sheet
+
+        Returns:
+            Dict mapping each sheet name to its row dictionaries
+        """
+        range_specs = [
+            f"'{sheet}'!{notation}" if notation else f"'{sheet}'"
+            for sheet, notation in ranges
+        ]
+
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .batchGet(spreadsheetId=spreadsheet_id, ranges=range_specs)
+                .execute()
+            )
+        except Exception as e:
+            logger.error(f"Failed to batch-read sheets: {e}")
+            raise
+
+        # valueRanges come back in request order, so pair them up by
+        # position rather than parsing the echoed range strings
+        value_ranges = result.get("valueRanges", [])
+        return {
+            sheet: self._values_to_dicts(value_range.get("values", []))
+            for (sheet, _), value_range in zip(ranges, value_ranges)
+        }
+
+    def _fetch_values(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        range_notation: Optional[str] = None,
+    ) -> list[list]:
+        """Fetch raw cell values for a sheet (or a range within it)."""
         if range_notation:
             full_range = f"'{sheet_name}'!{range_notation}"
         else:
@@ -166,29 +332,7 @@ class SheetsClient:
             logger.error(f"Failed to read sheet: {e}")
             raise
 
-        values = result.get("values", [])
-        if not values:
-            return []
-
-        if include_headers:
-            headers = values[0]
-            data_rows = values[1:]
-        else:
-            # Generate column names
-            max_cols = max(len(row) for row in values) if values else 0
-            headers = [f"column_{i}" for i in range(max_cols)]
-            data_rows = values
-
-        rows = []
-        for row in data_rows:
-            row_dict = {}
-            for i, header in enumerate(headers):
-                # Handle rows with fewer columns than headers
-                value = row[i] if i < len(row) else ""
-                row_dict[header] = value
-            rows.append(row_dict)
-
-        return rows
+        return result.get("values", [])
 
     def find_rows(
         self,
@@ -197,34 +341,105 @@ class SheetsClient:
         column: str,
         value: str,
         exact_match: bool = True,
+        limit: Optional[int] = None,
     ) -> list[dict]:
         """
         Find rows where a column matches a value.
 
+        Matching runs over the raw values, so only rows that actually
+        match are built into dicts, and a limit stops the scan early —
+        an ID lookup that hits the first row never touches the rest.
+
         Args:
             spreadsheet_id: The spreadsheet ID
             sheet_name: Name of the sheet (tab)
             column: Column name to search
             value: Value to search for
             exact_match: If True, exact match. If False, contains match.
+            limit: Stop after this many matches (None for all)
 
         Returns:
             List of matching row dictionaries
         """
-        all_rows = self.read_sheet(spreadsheet_id, sheet_name)
+        values = self._fetch_values(spreadsheet_id, sheet_name)
+        if not values:
+            return []
+
+        headers = values[0]
+        try:
+            col = headers.index(column)
+        except ValueError:
+            return []
+
+        # A precompiled case-insensitive regex scans in C and avoids the
+        # two .lower() allocations per row; re.escape keeps needles with
+        # regex metacharacters literal
+        search = None if exact_match else re.compile(
+            re.escape(value), re.IGNORECASE
+        ).search
+        n_headers = len(headers)
 
         matching = []
-        for row in all_rows:
-            cell_value = row.get(column, "")
-            if exact_match:
-                if cell_value == value:
-                    matching.append(row)
-            else:
-                if value.lower() in cell_value.lower():
-                    matching.append(row)
+        for row in values[1:]:
+            cell = row[col] if col < len(row) else ""
+            if (cell == value) if exact_match else search(cell):
+                matching.append(
+                    dict(zip(headers, row))
+                    if len(row) >= n_headers
+                    else dict(zip_longest(headers, row, fillvalue=""))
+                )
+                if limit is not None and len(matching) >= limit:
+                    break
 
         return matching
 
+    def count_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        column: str,
+        value: str,
+        exact_match: bool = True,
+    ) -> int:
+        """
+        Count rows where a column matches a value.
+
+        Cheaper than len(find_rows(...)) when only the count is needed:
+        the scan runs over the raw values inside a C-level sum and no
+        row dicts are built at all.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet (tab)
+            column: Column name to search
+            value: Value to search for
+            exact_match: If True, exact match. If False, contains match.
+
+        Returns:
+            Number of matching rows
+        """
+        values = self._fetch_values(spreadsheet_id, sheet_name)
+        if not values:
+            return 0
+
+        headers = values[0]
+        try:
+            col = headers.index(column)
+        except ValueError:
+            return 0
+
+        if exact_match:
+            return sum(
+                1 for row in values[1:]
+                if (row[col] if col < len(row) else "") == value
+            )
+
+        search = re.compile(re.escape(value), re.IGNORECASE).search
+        return sum(
+            1 for row in values[1:]
+            if search(row[col] if col < len(row) else "")
+        )
+
     def get_row_by_id(
         self,
         spreadsheet_id: str,
@@ -235,6 +450,11 @@ class SheetsClient:
         """
         Get a single row by ID column value.
 
+        The first lookup reads the sheet once and builds an ID -> row
+        index; later lookups on the same column are dict hits with no
+        API call or scan. The index lives in the metadata cache, so it
+        ages out with the TTL and refresh_info drops it.
+
         Args:
             spreadsheet_id: The spreadsheet ID
             sheet_name: Name of the sheet (tab)
@@ -244,7 +464,20 @@ class SheetsClient:
         Returns:
             Row dictionary or None if not found
         """
-        matches = self.find_rows(
-            spreadsheet_id, sheet_name, id_column, id_value, exact_match=True
-        )
-        return matches[0] if matches else None
+        cache_key = ("index", spreadsheet_id, sheet_name)
+        indexes = self._info_cache.get(cache_key)
+        if indexes is None:
+            indexes = {}
+            self._info_cache.set(cache_key, indexes)
+
+        index = indexes.get(id_column)
+        if index is None:
+            index = {}
+            for row in self.read_sheet(spreadsheet_id, sheet_name):
+                key = row.get(id_column)
+                # First occurrence wins, matching the old limit=1 scan
+                if key is not None and key not in index:
+                    index[key] = row
+            indexes[id_column] = index
+
+        return index.get(id_value)
@@ -3,12 +3,13 @@
 This is a READ-ONLY MCP. It does not modify spreadsheet data.
 """
 import os
+from dataclasses import asdict
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
-from googleapiclient.discovery import build
 
 from shared.auth import GoogleAuth, SHEETS_SCOPES
+from shared.json_model import FastJsonModel
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import SheetsClient
 
@@ -54,7 +55,26 @@ def get_sheets_client() -> SheetsClient:
     )
 
     creds = auth.get_credentials()
-    service = build("sheets", "v4", credentials=creds)
+    # Imported lazily: discovery pulls in a large dependency graph that
+    # only matters once credentials exist
+    from googleapiclient.discovery import build
+
+    # Share one keep-alive transport across all tool calls instead of
+    # letting build() manage its own
+    import httplib2
+    import google_auth_httplib2
+
+    authed_http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(timeout=30)
+    )
+    service = build(
+        "sheets",
+        "v4",
+        http=authed_http,
+        model=FastJsonModel(),
+        static_discovery=True,  # Use the packaged discovery doc; no HTTP fetch
+        cache_discovery=False,
+    )
     client = SheetsClient(service=service)
 
     _sheets_client = client
@@ -109,7 +129,7 @@ def list_sheets(spreadsheet_id: str) -> list[dict]:
         List of sheets with title, sheet_id, row_count, column_count
     """
     client = get_sheets_client()
-    return client.list_sheets(spreadsheet_id)
+    return [asdict(sheet) for sheet in client.list_sheets(spreadsheet_id)]
 
 
 @mcp.tool()
@@ -161,6 +181,34 @@ def read_sheet(
     return rows[:limit]
 
 
+@mcp.tool()
+def read_sheets_batch(
+    spreadsheet_id: str,
+    sheet_names: list[str],
+    limit: int = 1000,
+) -> dict[str, list[dict]]:
+    """
+    Read several sheets (tabs) of one spreadsheet in a single call.
+
+    Prefer this over calling read_sheet once per tab — all tabs come
+    back in one API round trip. The first row of each sheet is treated
+    as column headers.
+
+    Args:
+        spreadsheet_id: The Google Sheets spreadsheet ID
+        sheet_names: Names of the sheets (tabs) to read
+        limit: Maximum number of rows to return per sheet (default 1000)
+
+    Returns:
+        Dict mapping each sheet name to its list of row dictionaries
+    """
+    client = get_sheets_client()
+    results = client.read_sheets_batch(
+        spreadsheet_id, [(name, None) for name in sheet_names]
+    )
+    return {name: rows[:limit] for name, rows in results.items()}
+
+
 @mcp.tool()
 def find_rows(
     spreadsheet_id: str,
@@ -191,3 +239,38 @@ def find_rows(
         value=value,
         exact_match=exact_match,
     )
+
+
+@mcp.tool()
+def count_rows(
+    spreadsheet_id: str,
+    sheet_name: str,
+    column: str,
+    value: str,
+    exact_match: bool = True,
+) -> int:
+    """
+    Count rows where a column matches a value.
+
+    Prefer this over find_rows when only the number of matches is
+    needed — the matching rows are never materialized or returned.
+
+    Args:
+        spreadsheet_id: The Google Sheets spreadsheet ID
+        sheet_name: Name of the sheet (tab) to search
+        column: Column name to search in
+        value: Value to search for
+        exact_match: If True, requires exact match. If False, counts
+                    rows where the column contains the value (case-insensitive).
+
+    Returns:
+        Number of matching rows
+    """
+    client = get_sheets_client()
+    return client.count_rows(
+        spreadsheet_id=spreadsheet_id,
+        sheet_name=sheet_name,
+        column=column,
+        value=value,
+        exact_match=exact_match,
+    )
@@ -3,12 +3,8 @@
 import argparse
 import os
 import sys
-from pathlib import Path
+from functools import lru_cache
 
-# Add parent to path for shared imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from googleapiclient.discovery import build
 from shared.auth import GoogleAuth, SLIDES_SCOPES
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import SlidesClient
@@ -16,6 +12,33 @@ from .client import SlidesClient
 APP_NAME = os.environ.get("GOOGLE_MCP_APP_NAME", "letter-rip")
 
 
+@lru_cache(maxsize=4)
+def _build_client(app_name: str) -> SlidesClient:
+    """
+    Build an authenticated SlidesClient (cached per app name).
+
+    Repeated calls — e.g. from scripts that authenticate and then test —
+    reuse the credentials and discovery service instead of paying the
+    OAuth and service-build cost again.
+    """
+    paths = MCPPaths(app_name)
+    ensure_data_dirs(paths.data_dir)
+
+    auth = GoogleAuth(
+        credentials_path=paths.slides_credentials,
+        token_path=paths.slides_token,
+        scopes=SLIDES_SCOPES,
+    )
+    creds = auth.get_credentials()
+
+    # Imported lazily: discovery pulls in a large dependency graph that
+    # only matters once credentials exist
+    from googleapiclient.discovery import build
+
+    service = build("slides", "v1", credentials=creds)
+    return SlidesClient(service=service)
+
+
 def setup_auth(app_name: str = APP_NAME) -> SlidesClient:
     """
     Run OAuth flow for Slides API.
@@ -39,17 +62,10 @@ def setup_auth(app_name: str = APP_NAME) -> SlidesClient:
         sys.exit(1)
 
     print("\nAuthenticating with Google Slides...")
-    auth = GoogleAuth(
-        credentials_path=paths.slides_credentials,
-        token_path=paths.slides_token,
-        scopes=SLIDES_SCOPES,
-    )
-
-    creds = auth.get_credentials()
+    client = _build_client(app_name)
     print("Authentication successful!")
 
-    service = build("slides", "v1", credentials=creds)
-    return SlidesClient(service=service)
+    return client
 
 
 def test_connection(client: SlidesClient, presentation_id: str):
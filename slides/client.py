@@ -1,9 +1,15 @@
 """Google Slides API client wrapper."""
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import io
 import logging
-import uuid
+import secrets
+import threading
 
-from .models import Presentation, Slide, PageElement
+from shared.cache import TTLCache
+from shared.retry import execute_with_retry
+
+from .models import Presentation, Slide, PageElement, extract_slide_text
 
 logger = logging.getLogger("google_mcps.slides")
 
@@ -11,6 +17,36 @@ logger = logging.getLogger("google_mcps.slides")
 EMU_PER_POINT = 12700
 
 
+def _points_to_emu(points: float) -> int:
+    """Convert points to EMU (English Metric Units)."""
+    return int(points * EMU_PER_POINT)
+
+
+# Seconds to cache parsed slide lists; presentations().get() is the most
+# expensive call in this module and the read helpers all funnel into it
+_SLIDES_TTL = 30.0
+
+# Worker threads for multi-presentation fan-out
+_POOL_WORKERS = 8
+
+# Partial-response masks: ask only for what the models parse. The full
+# presentation payload carries per-run text styling, layout/master
+# properties, and notes pages the models never look at. Presence-only
+# element types (image, video, ...) request one always-present subfield
+# so the key still appears for type detection.
+_PRESENTATION_FIELDS = "presentationId,title,locale,pageSize,slides/objectId"
+_ELEMENT_FIELDS = (
+    "objectId,title,description,"
+    "shape/text/textElements/textRun/content,"
+    "table/tableRows/tableCells/text/textElements/textRun/content,"
+    "image/contentUrl,video/id,line/lineProperties,"
+    "sheetsChart/spreadsheetId,wordArt/renderedText"
+)
+_SLIDES_FIELDS = f"slides(objectId,pageType,pageElements({_ELEMENT_FIELDS}))"
+_PAGE_FIELDS = f"objectId,pageType,pageElements({_ELEMENT_FIELDS})"
+_SLIDE_IDS_FIELDS = "slides(objectId,pageType)"
+
+
 class SlidesClient:
     """Wrapper for Google Slides API operations."""
 
@@ -22,6 +58,16 @@ class SlidesClient:
             service: Google Slides API service object
         """
         self.service = service
+        self._slides_cache = TTLCache(maxsize=32, ttl=_SLIDES_TTL)
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def invalidate(self, presentation_id: str) -> None:
+        """Drop cached slides for a presentation (e.g. after editing it)."""
+        self._slides_cache.pop(presentation_id)
+        self._slides_cache.pop(("index", presentation_id))
+        self._slides_cache.pop(("ids", presentation_id))
+        self._slides_cache.pop(("presentation", presentation_id))
 
     def get_presentation(self, presentation_id: str) -> Presentation:
         """
@@ -33,17 +79,24 @@ class SlidesClient:
         Returns:
             Presentation object with title, slide count, etc.
         """
+        cache_key = ("presentation", presentation_id)
+        cached = self._slides_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            result = (
-                self.service.presentations()
-                .get(presentationId=presentation_id)
-                .execute()
+            result = execute_with_retry(
+                self.service.presentations().get(
+                    presentationId=presentation_id, fields=_PRESENTATION_FIELDS
+                )
             )
         except Exception as e:
             logger.error(f"Failed to get presentation {presentation_id}: {e}")
             raise
 
-        return Presentation.from_api_response(result)
+        presentation = Presentation.from_api_response(result)
+        self._slides_cache.set(cache_key, presentation)
+        return presentation
 
     def list_slides(self, presentation_id: str) -> list[Slide]:
         """
@@ -55,26 +108,77 @@ class SlidesClient:
         Returns:
             List of Slide objects with their elements
         """
+        cached = self._slides_cache.get(presentation_id)
+        if cached is not None:
+            return cached
+
         try:
-            result = (
-                self.service.presentations()
-                .get(presentationId=presentation_id)
-                .execute()
+            result = execute_with_retry(
+                self.service.presentations().get(
+                    presentationId=presentation_id, fields=_SLIDES_FIELDS
+                )
             )
         except Exception as e:
             logger.error(f"Failed to list slides for {presentation_id}: {e}")
             raise
 
-        slides = []
-        for slide_data in result.get("slides", []):
-            slides.append(Slide.from_api_response(slide_data))
-
+        slides = [
+            Slide.from_api_response(slide_data)
+            for slide_data in result.get("slides", [])
+        ]
+        self._slides_cache.set(presentation_id, slides)
         return slides
 
+    def list_slide_ids(self, presentation_id: str) -> list[Slide]:
+        """
+        List slide shells (object ID and page type only).
+
+        Skips element payloads entirely, so the response for a large
+        deck is a few hundred bytes instead of megabytes. Use this when
+        only IDs or ordering matter; per-slide content can then be
+        fetched on demand with get_slide.
+
+        Args:
+            presentation_id: The presentation ID
+
+        Returns:
+            List of Slide objects with empty element lists
+        """
+        # A cached full listing already covers this
+        cached = self._slides_cache.get(presentation_id)
+        if cached is not None:
+            return cached
+
+        ids_key = ("ids", presentation_id)
+        cached = self._slides_cache.get(ids_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = execute_with_retry(
+                self.service.presentations().get(
+                    presentationId=presentation_id, fields=_SLIDE_IDS_FIELDS
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to list slide ids for {presentation_id}: {e}")
+            raise
+
+        shells = [
+            Slide.from_api_response(slide_data)
+            for slide_data in result.get("slides", [])
+        ]
+        self._slides_cache.set(ids_key, shells)
+        return shells
+
     def get_slide(self, presentation_id: str, slide_id: str) -> Optional[Slide]:
         """
         Get a specific slide by ID.
 
+        Served from an ID index when the full slide list is already
+        cached; otherwise only the single page is fetched, so looking up
+        one slide never downloads the whole deck.
+
         Args:
             presentation_id: The presentation ID
             slide_id: The slide's object ID
@@ -82,13 +186,32 @@ class SlidesClient:
         Returns:
             Slide object or None if not found
         """
-        slides = self.list_slides(presentation_id)
+        index_key = ("index", presentation_id)
+        index = self._slides_cache.get(index_key)
+        if index is not None:
+            return index.get(slide_id)
 
-        for slide in slides:
-            if slide.object_id == slide_id:
-                return slide
+        slides = self._slides_cache.get(presentation_id)
+        if slides is not None:
+            index = {slide.object_id: slide for slide in slides}
+            self._slides_cache.set(index_key, index)
+            return index.get(slide_id)
 
-        return None
+        try:
+            result = execute_with_retry(
+                self.service.presentations().pages().get(
+                    presentationId=presentation_id,
+                    pageObjectId=slide_id,
+                    fields=_PAGE_FIELDS,
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to get slide {slide_id} from {presentation_id}: {e}"
+            )
+            return None
+
+        return Slide.from_api_response(result)
 
     def get_slide_by_number(self, presentation_id: str, slide_number: int) -> Optional[Slide]:
         """
@@ -124,6 +247,106 @@ class SlidesClient:
             return slide.get_text_content()
         return ""
 
+    def _executor(self) -> ThreadPoolExecutor:
+        """Persistent worker pool, created on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="slides-io"
+            )
+        return self._pool
+
+    def _ensure_worker_http(self) -> None:
+        """
+        Give the current worker thread its own authorized transport.
+
+        httplib2 connections are not thread-safe, so each pool thread gets
+        a dedicated AuthorizedHttp sharing the service's credentials.
+        """
+        if getattr(self._local, "http", None) is None:
+            import httplib2
+            import google_auth_httplib2
+
+            creds = self.service._http.credentials
+            self._local.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http()
+            )
+
+    def get_presentation_text_many(
+        self, presentation_ids: list[str]
+    ) -> dict[str, list[dict]]:
+        """
+        Extract text from several presentations concurrently.
+
+        Each presentation is one HTTP round trip; fetching them on the
+        worker pool makes the wall-clock cost of a batch roughly one
+        round trip instead of one per deck. A deck that fails to fetch
+        maps to an empty list (and logs the error) rather than failing
+        the whole batch.
+
+        Args:
+            presentation_ids: The presentation IDs to read
+
+        Returns:
+            Dict mapping each presentation ID to its slide text dicts
+            (same shape as get_presentation_text)
+        """
+        if len(presentation_ids) == 1:
+            pid = presentation_ids[0]
+            return {pid: self.get_presentation_text(pid)}
+
+        def fetch_one(presentation_id: str) -> tuple[str, list[dict]]:
+            self._ensure_worker_http()
+            try:
+                result = execute_with_retry(
+                    self.service.presentations().get(
+                        presentationId=presentation_id, fields=_SLIDES_FIELDS
+                    ),
+                    http=self._local.http,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch presentation {presentation_id}: {e}"
+                )
+                return presentation_id, []
+
+            return presentation_id, [
+                {
+                    "slide_id": slide_data.get("objectId", ""),
+                    "slide_number": i,
+                    "text": extract_slide_text(slide_data),
+                }
+                for i, slide_data in enumerate(result.get("slides", ()), start=1)
+            ]
+
+        return dict(self._executor().map(fetch_one, presentation_ids))
+
+    def _iter_slide_texts(self, presentation_id: str):
+        """
+        Yield (slide_id, slide_number, text) for every slide.
+
+        Served from cached Slide objects when a listing is in the cache;
+        otherwise the raw payload is walked with extract_slide_text, so
+        text-only calls never build the per-element object graph.
+        """
+        cached = self._slides_cache.get(presentation_id)
+        if cached is not None:
+            for i, slide in enumerate(cached, start=1):
+                yield slide.object_id, i, slide.get_text_content()
+            return
+
+        try:
+            result = execute_with_retry(
+                self.service.presentations().get(
+                    presentationId=presentation_id, fields=_SLIDES_FIELDS
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to get text for {presentation_id}: {e}")
+            raise
+
+        for i, slide_data in enumerate(result.get("slides", ()), start=1):
+            yield slide_data.get("objectId", ""), i, extract_slide_text(slide_data)
+
     def get_presentation_text(self, presentation_id: str) -> list[dict]:
         """
         Get text from all slides in a presentation.
@@ -134,18 +357,14 @@ class SlidesClient:
         Returns:
             List of dicts with slide_id, slide_number, and text
         """
-        slides = self.list_slides(presentation_id)
-
-        result = []
-        for i, slide in enumerate(slides, start=1):
-            text = slide.get_text_content()
-            result.append({
-                "slide_id": slide.object_id,
-                "slide_number": i,
+        return [
+            {
+                "slide_id": slide_id,
+                "slide_number": number,
                 "text": text,
-            })
-
-        return result
+            }
+            for slide_id, number, text in self._iter_slide_texts(presentation_id)
+        ]
 
     def get_all_text(self, presentation_id: str) -> str:
         """
@@ -159,19 +378,113 @@ class SlidesClient:
         Returns:
             All text content concatenated with slide separators
         """
-        slides_text = self.get_presentation_text(presentation_id)
-
-        parts = []
-        for slide in slides_text:
-            if slide["text"]:
-                parts.append(f"--- Slide {slide['slide_number']} ---\n{slide['text']}")
-
-        return "\n\n".join(parts)
+        # Stream into a StringIO: no intermediate list of dicts holding
+        # every slide's text a second time, and no per-slide f-string
+        # copies before the final join
+        buf = io.StringIO()
+        for _slide_id, number, text in self._iter_slide_texts(presentation_id):
+            if text:
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(f"--- Slide {number} ---\n")
+                buf.write(text)
+
+        return buf.getvalue()
 
     # =========================================================================
     # Write Operations
     # =========================================================================
 
+    def batch_write(self, presentation_id: str, requests: list[dict]) -> dict:
+        """
+        Submit update requests in a single batchUpdate call.
+
+        Every write in this client funnels through here: callers build
+        their request dicts and one HTTP round trip applies them all.
+        Cached slide data for the presentation is invalidated on
+        success.
+
+        Args:
+            presentation_id: The presentation ID
+            requests: Slides API update request dicts
+
+        Returns:
+            The raw batchUpdate response
+        """
+        try:
+            result = execute_with_retry(
+                self.service.presentations().batchUpdate(
+                    presentationId=presentation_id,
+                    body={"requests": requests},
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to update presentation {presentation_id}: {e}")
+            raise
+
+        self.invalidate(presentation_id)
+        return result
+
+    @staticmethod
+    def _create_slide_request(
+        slide_id: str, layout: str, insert_at: int
+    ) -> dict:
+        """Build a createSlide request dict."""
+        request = {
+            "createSlide": {
+                "objectId": slide_id,
+                "slideLayoutReference": {
+                    "predefinedLayout": layout,
+                },
+            }
+        }
+
+        if insert_at >= 0:
+            request["createSlide"]["insertionIndex"] = insert_at
+
+        return request
+
+    @staticmethod
+    def _text_box_requests(
+        slide_id: str,
+        element_id: str,
+        text: str,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+    ) -> list[dict]:
+        """Build the createShape + insertText pair for one text box."""
+        return [
+            {
+                "createShape": {
+                    "objectId": element_id,
+                    "shapeType": "TEXT_BOX",
+                    "elementProperties": {
+                        "pageObjectId": slide_id,
+                        "size": {
+                            "width": {"magnitude": _points_to_emu(width), "unit": "EMU"},
+                            "height": {"magnitude": _points_to_emu(height), "unit": "EMU"},
+                        },
+                        "transform": {
+                            "scaleX": 1,
+                            "scaleY": 1,
+                            "translateX": _points_to_emu(x),
+                            "translateY": _points_to_emu(y),
+                            "unit": "EMU",
+                        },
+                    },
+                }
+            },
+            {
+                "insertText": {
+                    "objectId": element_id,
+                    "insertionIndex": 0,
+                    "text": text,
+                }
+            },
+        ]
+
     def create_presentation(self, title: str) -> Presentation:
         """
         Create a new presentation.
@@ -185,7 +498,9 @@ class SlidesClient:
         body = {"title": title}
 
         try:
-            result = self.service.presentations().create(body=body).execute()
+            result = execute_with_retry(
+                self.service.presentations().create(body=body)
+            )
         except Exception as e:
             logger.error(f"Failed to create presentation: {e}")
             raise
@@ -209,30 +524,56 @@ class SlidesClient:
         Returns:
             The new slide's object ID
         """
-        slide_id = f"slide_{uuid.uuid4().hex[:8]}"
+        slide_id = f"slide_{secrets.token_hex(4)}"
+        request = self._create_slide_request(slide_id, layout, insert_at)
+        self.batch_write(presentation_id, [request])
+        return slide_id
 
-        request = {
-            "createSlide": {
-                "objectId": slide_id,
-                "slideLayoutReference": {
-                    "predefinedLayout": layout,
-                },
-            }
-        }
+    def create_slide_with_text_boxes(
+        self,
+        presentation_id: str,
+        boxes: list[dict],
+        layout: str = "BLANK",
+        insert_at: int = -1,
+    ) -> tuple[str, list[str]]:
+        """
+        Create a slide and populate it with text boxes in one call.
 
-        if insert_at >= 0:
-            request["createSlide"]["insertionIndex"] = insert_at
+        The createSlide request and every box's createShape+insertText
+        pair go out in a single batchUpdate, so building a finished
+        slide costs one round trip instead of 1 + N.
 
-        try:
-            self.service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={"requests": [request]},
-            ).execute()
-        except Exception as e:
-            logger.error(f"Failed to create slide: {e}")
-            raise
+        Args:
+            presentation_id: The presentation ID
+            boxes: Dicts with "text" and optional "x", "y", "width",
+                   "height" (points; same defaults as add_text_box)
+            layout: Predefined layout - BLANK, TITLE, TITLE_AND_BODY, etc.
+            insert_at: Position to insert (-1 = append at end)
 
-        return slide_id
+        Returns:
+            Tuple of (new slide ID, list of new text box element IDs)
+        """
+        slide_id = f"slide_{secrets.token_hex(4)}"
+        requests = [self._create_slide_request(slide_id, layout, insert_at)]
+
+        element_ids = []
+        for box in boxes:
+            element_id = f"textbox_{secrets.token_hex(4)}"
+            element_ids.append(element_id)
+            requests.extend(
+                self._text_box_requests(
+                    slide_id,
+                    element_id,
+                    box["text"],
+                    x=box.get("x", 100),
+                    y=box.get("y", 100),
+                    width=box.get("width", 400),
+                    height=box.get("height", 100),
+                )
+            )
+
+        self.batch_write(presentation_id, requests)
+        return slide_id, element_ids
 
     def add_text_box(
         self,
@@ -259,50 +600,50 @@ class SlidesClient:
         Returns:
             The new text box element's object ID
         """
-        element_id = f"textbox_{uuid.uuid4().hex[:8]}"
+        element_id = f"textbox_{secrets.token_hex(4)}"
+        requests = self._text_box_requests(
+            slide_id, element_id, text, x, y, width, height
+        )
+        self.batch_write(presentation_id, requests)
+        return element_id
 
-        requests = [
-            # Create the shape
-            {
-                "createShape": {
-                    "objectId": element_id,
-                    "shapeType": "TEXT_BOX",
-                    "elementProperties": {
-                        "pageObjectId": slide_id,
-                        "size": {
-                            "width": {"magnitude": self._points_to_emu(width), "unit": "EMU"},
-                            "height": {"magnitude": self._points_to_emu(height), "unit": "EMU"},
-                        },
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": self._points_to_emu(x),
-                            "translateY": self._points_to_emu(y),
-                            "unit": "EMU",
-                        },
-                    },
-                }
-            },
-            # Insert text into the shape
-            {
-                "insertText": {
-                    "objectId": element_id,
-                    "insertionIndex": 0,
-                    "text": text,
-                }
-            },
-        ]
+    def bulk_add_text_boxes(
+        self,
+        presentation_id: str,
+        slide_id: str,
+        boxes: list[dict],
+    ) -> list[str]:
+        """
+        Add several text boxes to a slide in one batchUpdate.
 
-        try:
-            self.service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={"requests": requests},
-            ).execute()
-        except Exception as e:
-            logger.error(f"Failed to add text box: {e}")
-            raise
+        Args:
+            presentation_id: The presentation ID
+            slide_id: The slide's object ID
+            boxes: Dicts with "text" and optional "x", "y", "width",
+                   "height" (points; same defaults as add_text_box)
 
-        return element_id
+        Returns:
+            List of new text box element IDs, in box order
+        """
+        requests = []
+        element_ids = []
+        for box in boxes:
+            element_id = f"textbox_{secrets.token_hex(4)}"
+            element_ids.append(element_id)
+            requests.extend(
+                self._text_box_requests(
+                    slide_id,
+                    element_id,
+                    box["text"],
+                    x=box.get("x", 100),
+                    y=box.get("y", 100),
+                    width=box.get("width", 400),
+                    height=box.get("height", 100),
+                )
+            )
+
+        self.batch_write(presentation_id, requests)
+        return element_ids
 
     def delete_slide(self, presentation_id: str, slide_id: str) -> bool:
         """
@@ -321,18 +662,5 @@ class SlidesClient:
             }
         }
 
-        try:
-            self.service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={"requests": [request]},
-            ).execute()
-        except Exception as e:
-            logger.error(f"Failed to delete slide {slide_id}: {e}")
-            raise
-
+        self.batch_write(presentation_id, [request])
         return True
-
-    @staticmethod
-    def _points_to_emu(points: float) -> int:
-        """Convert points to EMU (English Metric Units)."""
-        return int(points * EMU_PER_POINT)
@@ -1,9 +1,14 @@
 """Data models for Google Slides API."""
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
+# Shared .get() default; avoids allocating a fresh {} or [] per lookup
+# in the extraction loops below
+_EMPTY: dict = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class Presentation:
     """Information about a presentation."""
     id: str
@@ -35,92 +40,143 @@ class Presentation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PageElement:
     """An element on a slide (shape, image, table, etc.)."""
     object_id: str
     element_type: str  # SHAPE, IMAGE, TABLE, VIDEO, LINE, etc.
     title: Optional[str] = None
     description: Optional[str] = None
-    text_content: Optional[str] = None
+    # Raw payload of text-bearing elements; text is extracted from it
+    # lazily so callers that never read text_content (slide listings,
+    # ID lookups) skip the string work entirely
+    _raw: Optional[dict] = field(default=None, repr=False)
+    _text: Optional[str] = field(default=None, repr=False)
+    _extracted: bool = field(default=False, repr=False)
 
     @classmethod
     def from_api_response(cls, data: dict) -> "PageElement":
         """Parse from Slides API pageElement response."""
         object_id = data.get("objectId", "")
 
-        # Determine element type
+        # Determine element type: one C-level key intersection instead
+        # of a cascade of `in` checks (real elements carry exactly one
+        # type key)
         element_type = "UNKNOWN"
-        text_content = None
-
-        if "shape" in data:
-            element_type = "SHAPE"
-            text_content = cls._extract_text(data["shape"])
-        elif "image" in data:
-            element_type = "IMAGE"
-        elif "table" in data:
-            element_type = "TABLE"
-            text_content = cls._extract_table_text(data["table"])
-        elif "video" in data:
-            element_type = "VIDEO"
-        elif "line" in data:
-            element_type = "LINE"
-        elif "sheetsChart" in data:
-            element_type = "SHEETS_CHART"
-        elif "wordArt" in data:
-            element_type = "WORD_ART"
-            text_content = cls._extract_text(data.get("wordArt", {}))
+        raw = None
+
+        for key in _TYPE_HANDLERS.keys() & data.keys():
+            element_type, extractor = _TYPE_HANDLERS[key]
+            if extractor is not None:
+                raw = data[key]
+            break
 
         return cls(
             object_id=object_id,
             element_type=element_type,
             title=data.get("title"),
             description=data.get("description"),
-            text_content=text_content,
+            _raw=raw,
         )
 
+    @property
+    def has_text(self) -> bool:
+        """Whether this element contains any text, without joining it."""
+        if self._extracted:
+            return bool(self._text)
+        if self._raw is None:
+            return False
+        # any() stops at the first non-empty text run, skipping the
+        # join/strip work text_content would do
+        if self.element_type == "TABLE":
+            return any(
+                element.get("textRun", _EMPTY).get("content", "").strip()
+                for row in self._raw.get("tableRows", ())
+                for cell in row.get("tableCells", ())
+                for element in cell.get("text", _EMPTY).get("textElements", ())
+            )
+        return any(
+            element.get("textRun", _EMPTY).get("content", "").strip()
+            for element in self._raw.get("text", _EMPTY).get("textElements", ())
+        )
+
+    @property
+    def text_content(self) -> Optional[str]:
+        """Text in this element, extracted and memoized on first access."""
+        if not self._extracted:
+            self._extracted = True
+            if self._raw is not None:
+                self._text = _EXTRACTORS[self.element_type](self._raw)
+        return self._text
+
     @staticmethod
     def _extract_text(shape_data: dict) -> Optional[str]:
         """Extract plain text from a shape's text content."""
-        text = shape_data.get("text", {})
-        text_elements = text.get("textElements", [])
-
-        parts = []
-        for element in text_elements:
-            text_run = element.get("textRun", {})
-            content = text_run.get("content", "")
-            if content:
-                parts.append(content)
-
-        result = "".join(parts).strip()
+        # Generators feed str.join directly: no intermediate part lists
+        # to append to and garbage-collect per shape
+        result = "".join(
+            element.get("textRun", _EMPTY).get("content", "")
+            for element in shape_data.get("text", _EMPTY).get("textElements", ())
+        ).strip()
         return result if result else None
 
     @staticmethod
     def _extract_table_text(table_data: dict) -> Optional[str]:
         """Extract text from all cells in a table."""
-        rows = table_data.get("tableRows", [])
-        parts = []
-
-        for row in rows:
-            cells = row.get("tableCells", [])
-            row_texts = []
-            for cell in cells:
-                text = cell.get("text", {})
-                text_elements = text.get("textElements", [])
-                cell_text = ""
-                for element in text_elements:
-                    text_run = element.get("textRun", {})
-                    content = text_run.get("content", "")
-                    if content:
-                        cell_text += content
-                row_texts.append(cell_text.strip())
-            parts.append(" | ".join(row_texts))
-
-        result = "\n".join(parts).strip()
+        result = "\n".join(
+            " | ".join(
+                "".join(
+                    element.get("textRun", _EMPTY).get("content", "")
+                    for element in cell.get("text", _EMPTY).get("textElements", ())
+                ).strip()
+                for cell in row.get("tableCells", ())
+            )
+            for row in table_data.get("tableRows", ())
+        ).strip()
         return result if result else None
 
 
-@dataclass
+# Element type key -> (element_type, text extractor). Built once at
+# import; from_api_response intersects this with the payload's keys.
+_TYPE_HANDLERS: dict[str, tuple[str, Optional[Any]]] = {
+    "shape": ("SHAPE", PageElement._extract_text),
+    "image": ("IMAGE", None),
+    "table": ("TABLE", PageElement._extract_table_text),
+    "video": ("VIDEO", None),
+    "line": ("LINE", None),
+    "sheetsChart": ("SHEETS_CHART", None),
+    "wordArt": ("WORD_ART", PageElement._extract_text),
+}
+
+# Extractor by element type, for the lazy text_content property
+_EXTRACTORS = {
+    "SHAPE": PageElement._extract_text,
+    "TABLE": PageElement._extract_table_text,
+    "WORD_ART": PageElement._extract_text,
+}
+
+
+def extract_slide_text(slide_data: dict) -> str:
+    """
+    Extract a slide's text straight from the raw API payload.
+
+    Text-only consumers (get_all_text, get_presentation_text) use this
+    to skip instantiating a Slide/PageElement object per element when
+    the graph would be thrown away immediately after joining the text.
+    """
+    texts = []
+    for element in slide_data.get("pageElements", ()):
+        for key in _TYPE_HANDLERS.keys() & element.keys():
+            extractor = _TYPE_HANDLERS[key][1]
+            if extractor is not None:
+                text = extractor(element[key])
+                if text:
+                    texts.append(text)
+            break
+    return "\n".join(texts)
+
+
+@dataclass(slots=True)
 class Slide:
     """A slide in a presentation."""
     object_id: str
@@ -136,14 +192,21 @@ class Slide:
 
         return cls(
             object_id=data.get("objectId", ""),
-            page_type=data.get("pageType", "SLIDE"),
+            # JSON parsing yields a fresh str per slide; interning makes
+            # every slide of a type share one object
+            page_type=sys.intern(data.get("pageType", "SLIDE")),
             elements=elements,
         )
 
+    @property
+    def has_text(self) -> bool:
+        """Whether any element carries text, without extracting it."""
+        return any(element.has_text for element in self.elements)
+
     def get_text_content(self) -> str:
         """Get all text content from this slide."""
-        texts = []
-        for element in self.elements:
-            if element.text_content:
-                texts.append(element.text_content)
-        return "\n".join(texts)
+        return "\n".join(
+            element.text_content
+            for element in self.elements
+            if element.text_content
+        )
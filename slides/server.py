@@ -1,4 +1,5 @@
 """Slides MCP Server - Google Slides operations via Model Context Protocol."""
+import asyncio
 import os
 from typing import Optional
 
@@ -6,6 +7,7 @@ from mcp.server.fastmcp import FastMCP
 from googleapiclient.discovery import build
 
 from shared.auth import GoogleAuth, SLIDES_SCOPES
+from shared.json_model import FastJsonModel
 from shared.paths import MCPPaths, ensure_data_dirs
 from .client import SlidesClient
 
@@ -51,7 +53,25 @@ def get_slides_client() -> SlidesClient:
     )
 
     creds = auth.get_credentials()
-    service = build("slides", "v1", credentials=creds)
+
+    # Share one keep-alive transport across all tool calls instead of
+    # letting build() manage its own
+    import httplib2
+    import google_auth_httplib2
+
+    authed_http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(timeout=30)
+    )
+    # Presentation payloads are deeply nested JSON (slides -> elements
+    # -> text runs); decode them with orjson when it's installed
+    service = build(
+        "slides",
+        "v1",
+        http=authed_http,
+        model=FastJsonModel(),
+        static_discovery=True,  # Use the packaged discovery doc; no HTTP fetch
+        cache_discovery=False,
+    )
     client = SlidesClient(service=service)
 
     _slides_client = client
@@ -64,7 +84,7 @@ def get_slides_client() -> SlidesClient:
 
 
 @mcp.tool()
-def get_presentation(presentation_id: str) -> dict:
+async def get_presentation(presentation_id: str) -> dict:
     """
     Get presentation metadata including title and slide count.
 
@@ -74,8 +94,8 @@ def get_presentation(presentation_id: str) -> dict:
     Returns:
         Presentation info with id, title, slide_count, and page_size.
     """
-    client = get_slides_client()
-    pres = client.get_presentation(presentation_id)
+    client = await asyncio.to_thread(get_slides_client)
+    pres = await asyncio.to_thread(client.get_presentation, presentation_id)
 
     return {
         "id": pres.id,
@@ -87,7 +107,7 @@ def get_presentation(presentation_id: str) -> dict:
 
 
 @mcp.tool()
-def list_slides(presentation_id: str) -> list[dict]:
+async def list_slides(presentation_id: str) -> list[dict]:
     """
     List all slides with their IDs and element summaries.
 
@@ -97,44 +117,65 @@ def list_slides(presentation_id: str) -> list[dict]:
     Returns:
         List of slides with slide_number, object_id, element_count, and has_text flag.
     """
-    client = get_slides_client()
-    slides = client.list_slides(presentation_id)
+    client = await asyncio.to_thread(get_slides_client)
+    slides = await asyncio.to_thread(client.list_slides, presentation_id)
 
     return [
         {
             "slide_number": i + 1,
             "object_id": slide.object_id,
             "element_count": len(slide.elements),
-            "has_text": bool(slide.get_text_content()),
+            "has_text": slide.has_text,
         }
         for i, slide in enumerate(slides)
     ]
 
 
 @mcp.tool()
-def get_slide_text(presentation_id: str, slide_number: int = 0) -> dict:
+async def get_slide_text(
+    presentation_id: str,
+    slide_number: int = 0,
+    slide_id: str | None = None,
+) -> dict:
     """
     Get text content from a specific slide or all slides.
 
     Args:
         presentation_id: The presentation ID
         slide_number: Slide number (1-indexed). Use 0 to get text from all slides.
+        slide_id: The slide's object ID (e.g. from list_slides); takes
+            precedence over slide_number when provided
 
     Returns:
         Dict with slide_number (or "all") and text content.
     """
-    client = get_slides_client()
+    client = await asyncio.to_thread(get_slides_client)
+
+    if slide_id is not None:
+        slide = await asyncio.to_thread(client.get_slide, presentation_id, slide_id)
+        if slide is None:
+            return {
+                "slide_id": slide_id,
+                "error": f"Slide {slide_id} not found",
+                "text": "",
+            }
+        return {
+            "object_id": slide.object_id,
+            "text": slide.get_text_content(),
+        }
 
     if slide_number == 0:
         # Get all text
-        text = client.get_all_text(presentation_id)
+        text = await asyncio.to_thread(client.get_all_text, presentation_id)
         return {
             "slide_number": "all",
             "text": text,
         }
     else:
         # Get specific slide
-        slide = client.get_slide_by_number(presentation_id, slide_number)
+        slide = await asyncio.to_thread(
+            client.get_slide_by_number, presentation_id, slide_number
+        )
         if slide is None:
             return {
                 "slide_number": slide_number,
@@ -149,7 +190,7 @@ def get_slide_text(presentation_id: str, slide_number: int = 0) -> dict:
 
 
 @mcp.tool()
-def get_presentation_text(presentation_id: str) -> list[dict]:
+async def get_presentation_text(presentation_id: str) -> list[dict]:
     """
     Get all text content from presentation, organized by slide.
 
@@ -159,8 +200,27 @@ def get_presentation_text(presentation_id: str) -> list[dict]:
     Returns:
         List of dicts with slide_number, slide_id, and text for each slide.
     """
-    client = get_slides_client()
-    return client.get_presentation_text(presentation_id)
+    client = await asyncio.to_thread(get_slides_client)
+    return await asyncio.to_thread(client.get_presentation_text, presentation_id)
+
+
+@mcp.tool()
+async def get_many_presentations_text(presentation_ids: list[str]) -> dict[str, list[dict]]:
+    """
+    Get text from several presentations in one call.
+
+    The presentations are fetched concurrently, so a batch costs about
+    one round trip of wall-clock time instead of one per deck. A deck
+    that fails to fetch maps to an empty list.
+
+    Args:
+        presentation_ids: The presentation IDs to read
+
+    Returns:
+        Dict mapping each presentation ID to its per-slide text dicts
+    """
+    client = await asyncio.to_thread(get_slides_client)
+    return await asyncio.to_thread(client.get_presentation_text_many, presentation_ids)
 
 
 # =============================================================================
@@ -169,7 +229,7 @@ def get_presentation_text(presentation_id: str) -> list[dict]:
 
 
 @mcp.tool()
-def create_presentation(title: str) -> dict:
+async def create_presentation(title: str) -> dict:
     """
     Create a new Google Slides presentation.
 
@@ -179,8 +239,8 @@ def create_presentation(title: str) -> dict:
     Returns:
         New presentation info with id, title, and URL.
     """
-    client = get_slides_client()
-    pres = client.create_presentation(title)
+    client = await asyncio.to_thread(get_slides_client)
+    pres = await asyncio.to_thread(client.create_presentation, title)
 
     return {
         "id": pres.id,
@@ -190,7 +250,7 @@ def create_presentation(title: str) -> dict:
 
 
 @mcp.tool()
-def create_slide(
+async def create_slide(
     presentation_id: str,
     layout: str = "BLANK",
 ) -> dict:
@@ -213,8 +273,10 @@ def create_slide(
     Returns:
         New slide info with object_id.
     """
-    client = get_slides_client()
-    slide_id = client.create_slide(presentation_id, layout=layout)
+    client = await asyncio.to_thread(get_slides_client)
+    slide_id = await asyncio.to_thread(
+        client.create_slide, presentation_id, layout=layout
+    )
 
     return {
         "object_id": slide_id,
@@ -223,10 +285,45 @@ def create_slide(
 
 
 @mcp.tool()
-def add_text_to_slide(
+async def create_slide_with_content(
+    presentation_id: str,
+    texts: list[dict],
+    layout: str = "BLANK",
+) -> dict:
+    """
+    Add a new slide and fill it with text boxes in a single call.
+
+    Prefer this over create_slide followed by add_text_to_slide — the
+    slide and all its text boxes are created in one API round trip.
+
+    Args:
+        presentation_id: The presentation ID
+        texts: Text boxes to place on the new slide. Each dict needs
+            "text" and may set "x", "y", "width", "height" in points
+            (defaults 100, 100, 400, 100).
+        layout: Predefined layout type (see create_slide)
+
+    Returns:
+        New slide info with object_id and the created element_ids.
+    """
+    client = await asyncio.to_thread(get_slides_client)
+    slide_id, element_ids = await asyncio.to_thread(
+        client.create_slide_with_text_boxes, presentation_id, texts, layout=layout
+    )
+
+    return {
+        "object_id": slide_id,
+        "layout": layout,
+        "element_ids": element_ids,
+    }
+
+
+@mcp.tool()
+async def add_text_to_slide(
     presentation_id: str,
-    slide_number: int,
     text: str,
+    slide_number: int = 0,
+    slide_id: str | None = None,
     x: int = 100,
     y: int = 100,
     width: int = 400,
@@ -235,10 +332,14 @@ def add_text_to_slide(
     """
     Add a text box to a slide.
 
+    Passing slide_id (from a prior list_slides call) skips the
+    presentation fetch needed to resolve a slide number.
+
     Args:
         presentation_id: The presentation ID
-        slide_number: Slide number (1-indexed)
         text: Text content to add
+        slide_number: Slide number (1-indexed); ignored when slide_id is given
+        slide_id: The slide's object ID; takes precedence over slide_number
         x: X position in points from left edge (default 100)
         y: Y position in points from top edge (default 100)
         width: Width in points (default 400)
@@ -247,18 +348,23 @@ def add_text_to_slide(
     Returns:
         New text box info with element_id.
     """
-    client = get_slides_client()
+    client = await asyncio.to_thread(get_slides_client)
 
-    # Get slide ID from number
-    slide = client.get_slide_by_number(presentation_id, slide_number)
-    if slide is None:
-        return {
-            "error": f"Slide {slide_number} not found",
-        }
+    if slide_id is None:
+        # Resolve slide ID from number (cache-backed)
+        slide = await asyncio.to_thread(
+            client.get_slide_by_number, presentation_id, slide_number
+        )
+        if slide is None:
+            return {
+                "error": f"Slide {slide_number} not found",
+            }
+        slide_id = slide.object_id
 
-    element_id = client.add_text_box(
+    element_id = await asyncio.to_thread(
+        client.add_text_box,
         presentation_id=presentation_id,
-        slide_id=slide.object_id,
+        slide_id=slide_id,
         text=text,
         x=float(x),
         y=float(y),
@@ -269,5 +375,5 @@ def add_text_to_slide(
     return {
         "element_id": element_id,
         "slide_number": slide_number,
-        "slide_id": slide.object_id,
+        "slide_id": slide_id,
     }
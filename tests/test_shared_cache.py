@@ -0,0 +1,131 @@
+"""Tests for shared TTL cache."""
+import pytest
+from shared.cache import DiskTTLCache, TTLCache
+
+
+class FakeClock:
+    """Controllable timer for testing expiry."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class TestTTLCache:
+    """Test TTLCache class."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        return TTLCache(maxsize=3, ttl=60, timer=clock)
+
+    def test_get_miss(self, cache):
+        """Missing keys should return default."""
+        assert cache.get("missing") is None
+        assert cache.get("missing", default=[]) == []
+
+    def test_set_and_get(self, cache):
+        """Stored values should be returned before expiry."""
+        cache.set(("list_events", "primary"), ["event"])
+        assert cache.get(("list_events", "primary")) == ["event"]
+
+    def test_expiry(self, cache, clock):
+        """Entries should expire after the TTL."""
+        cache.set("key", "value")
+        clock.advance(59)
+        assert cache.get("key") == "value"
+        clock.advance(2)
+        assert cache.get("key") is None
+
+    def test_per_entry_ttl_override(self, cache, clock):
+        """A per-entry TTL should override the cache-wide one."""
+        cache.set("short", "value", ttl=10)
+        cache.set("long", "value")
+        clock.advance(11)
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+
+    def test_lru_eviction(self, cache):
+        """Oldest entry should be evicted when full."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")  # Touch "a" so "b" is least recently used
+        cache.set("d", 4)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("d") == 4
+
+    def test_invalidate_predicate(self, cache):
+        """Invalidate should remove only matching keys."""
+        cache.set(("list_events", "primary"), [])
+        cache.set(("list_events", "work"), [])
+        cache.set(("list_calendars",), [])
+
+        removed = cache.invalidate(lambda key: len(key) > 1 and key[1] == "primary")
+
+        assert removed == 1
+        assert cache.get(("list_events", "primary")) is None
+        assert cache.get(("list_events", "work")) == []
+        assert cache.get(("list_calendars",)) == []
+
+    def test_clear(self, cache):
+        """Clear should remove everything."""
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_contains_none_value(self, cache):
+        """None is a valid cached value for membership checks."""
+        cache.set("key", None)
+        assert "key" in cache
+
+
+class TestDiskTTLCache:
+    """Test DiskTTLCache class."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        return DiskTTLCache(tmp_path / "cache" / "value.json", ttl=60, timer=clock)
+
+    def test_load_missing(self, cache):
+        """A missing file should be a miss."""
+        assert cache.load() is None
+
+    def test_store_and_load(self, cache):
+        """Stored values should round-trip through the file."""
+        cache.store([{"id": "primary"}])
+        assert cache.load() == [{"id": "primary"}]
+
+    def test_expiry(self, cache, clock):
+        """Values should expire after the TTL."""
+        cache.store(["item"])
+        clock.advance(61)
+        assert cache.load() is None
+
+    def test_corrupt_file(self, cache):
+        """An unreadable file should be a miss, not an error."""
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_text("not json", encoding="utf-8")
+        assert cache.load() is None
+
+    def test_invalidate(self, cache):
+        """Invalidate should remove the file."""
+        cache.store(["item"])
+        cache.invalidate()
+        assert cache.load() is None
+        # Invalidating again is a no-op
+        cache.invalidate()
@@ -0,0 +1,76 @@
+"""Tests for the persistent email cache."""
+import pytest
+from shared.email_cache import EmailCache
+
+
+class FakeClock:
+    """Controllable timer for testing entry timestamps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class TestEmailCache:
+    """Test EmailCache class."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        cache = EmailCache(tmp_path / "emails.db", maxsize=3, timer=clock)
+        yield cache
+        cache.close()
+
+    def test_get_miss(self, cache):
+        """Missing messages should return None."""
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self, cache, clock):
+        """Stored fields should round-trip with their timestamp."""
+        clock.advance(5)
+        cache.set("m1", {"id": "m1", "body": "hello", "labels": ["INBOX"]})
+        fields, ts = cache.get("m1")
+        assert fields["body"] == "hello"
+        assert ts == 5.0
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        """Entries should survive reopening the database."""
+        first = EmailCache(tmp_path / "emails.db", timer=clock)
+        first.set("m1", {"id": "m1", "body": "hello"})
+        first.close()
+
+        second = EmailCache(tmp_path / "emails.db", timer=clock)
+        fields, _ = second.get("m1")
+        assert fields["body"] == "hello"
+        second.close()
+
+    def test_update_labels(self, cache, clock):
+        """Label refresh should replace labels and bump the timestamp."""
+        cache.set("m1", {"id": "m1", "body": "hello", "labels": ["INBOX"]})
+        clock.advance(100)
+        cache.update_labels("m1", ["INBOX", "FYI"])
+        fields, ts = cache.get("m1")
+        assert fields["labels"] == ["INBOX", "FYI"]
+        assert ts == 100.0
+
+    def test_eviction_beyond_maxsize(self, cache, clock):
+        """Oldest entries should be evicted past maxsize."""
+        for i in range(4):
+            clock.advance(1)
+            cache.set(f"m{i}", {"id": f"m{i}"})
+        assert cache.get("m0") is None
+        assert cache.get("m3") is not None
+
+    def test_pop(self, cache):
+        """Dropped messages should be gone."""
+        cache.set("m1", {"id": "m1"})
+        cache.pop("m1")
+        assert cache.get("m1") is None
@@ -0,0 +1,85 @@
+"""Tests for retry helper."""
+import pytest
+from unittest.mock import Mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from shared import retry
+from shared.retry import execute_with_retry
+
+
+def make_http_error(status: int, headers: dict | None = None) -> HttpError:
+    """Build an HttpError with a given status."""
+    info = {"status": str(status)}
+    if headers:
+        info.update(headers)
+    resp = httplib2.Response(info)
+    return HttpError(resp, b"error")
+
+
+class TestExecuteWithRetry:
+    """Test execute_with_retry function."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Avoid real backoff delays in tests."""
+        self.sleeps = []
+        monkeypatch.setattr(retry.time, "sleep", self.sleeps.append)
+
+    def test_success_first_try(self):
+        """Should return the response without retrying."""
+        request = Mock()
+        request.execute.return_value = {"items": []}
+
+        result = execute_with_retry(request)
+
+        assert result == {"items": []}
+        assert request.execute.call_count == 1
+
+    def test_retries_transient_error(self):
+        """Should retry 429s and return the eventual success."""
+        request = Mock()
+        request.execute.side_effect = [
+            make_http_error(429),
+            make_http_error(503),
+            {"items": ["ok"]},
+        ]
+
+        result = execute_with_retry(request)
+
+        assert result == {"items": ["ok"]}
+        assert request.execute.call_count == 3
+        assert len(self.sleeps) == 2
+
+    def test_non_retryable_raises_immediately(self):
+        """404s should not be retried."""
+        request = Mock()
+        request.execute.side_effect = make_http_error(404)
+
+        with pytest.raises(HttpError):
+            execute_with_retry(request)
+
+        assert request.execute.call_count == 1
+
+    def test_gives_up_after_max_attempts(self):
+        """Persistent transient errors should eventually raise."""
+        request = Mock()
+        request.execute.side_effect = make_http_error(503)
+
+        with pytest.raises(HttpError):
+            execute_with_retry(request, max_attempts=3)
+
+        assert request.execute.call_count == 3
+
+    def test_honors_retry_after_header(self):
+        """Server-provided Retry-After should override computed backoff."""
+        request = Mock()
+        request.execute.side_effect = [
+            make_http_error(429, {"retry-after": "7"}),
+            {"ok": True},
+        ]
+
+        execute_with_retry(request)
+
+        assert self.sleeps == [7.0]
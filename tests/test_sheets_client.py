@@ -1,54 +1,156 @@
 """Tests for Sheets client."""
 import pytest
-from unittest.mock import Mock, MagicMock
 from sheets.client import SheetsClient, SheetInfo, SpreadsheetInfo
 
 
-class TestSheetsClient:
-    """Test SheetsClient class."""
+class FakeRequest:
+    """A prepared API call; execute() returns the canned payload."""
 
-    @pytest.fixture
-    def mock_service(self):
-        """Create a mock Sheets API service."""
-        return Mock()
+    __slots__ = ("_payload",)
 
-    @pytest.fixture
-    def client(self, mock_service):
-        """Create a SheetsClient with mock service."""
-        return SheetsClient(service=mock_service)
+    def __init__(self, payload):
+        self._payload = payload
 
-    def test_get_spreadsheet_info(self, client, mock_service):
-        """Should parse spreadsheet metadata correctly."""
-        mock_service.spreadsheets().get().execute.return_value = {
-            "spreadsheetId": "test-id",
+    def execute(self):
+        return self._payload
+
+
+class FakeValuesCollection:
+    """Stand-in for spreadsheets().values()."""
+
+    __slots__ = ("_service",)
+
+    def __init__(self, service):
+        self._service = service
+
+    def get(self, spreadsheetId, range, **kwargs):
+        self._service.values_calls += 1
+        return FakeRequest(self._service.values_payload)
+
+    def batchGet(self, spreadsheetId, ranges, **kwargs):
+        self._service.batch_calls += 1
+        self._service.last_ranges = list(ranges)
+        return FakeRequest(self._service.batch_payload)
+
+
+class FakeSheetsService:
+    """
+    Hand-rolled stand-in for the Sheets discovery service.
+
+    Tests assign the canned payloads and read the per-endpoint call
+    counters. Unlike a Mock chain, attribute access builds nothing: each
+    call is one slotted method, which keeps this file's setup cost flat
+    as tests are added.
+    """
+
+    __slots__ = (
+        "meta_payload",
+        "values_payload",
+        "batch_payload",
+        "meta_calls",
+        "values_calls",
+        "batch_calls",
+        "last_ranges",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear canned payloads and call counters between tests."""
+        self.meta_payload = {}
+        self.values_payload = {}
+        self.batch_payload = {}
+        self.meta_calls = 0
+        self.values_calls = 0
+        self.batch_calls = 0
+        self.last_ranges = None
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return FakeValuesCollection(self)
+
+    def get(self, spreadsheetId, **kwargs):
+        self.meta_calls += 1
+        return FakeRequest(self.meta_payload)
+
+
+# Payloads shared by several tests, built once at import instead of as
+# a fresh dict literal per test body
+_META_TWO_SHEETS = {
+    "spreadsheetId": "test-id",
+    "properties": {
+        "title": "Test Spreadsheet",
+        "locale": "en_US",
+        "timeZone": "America/New_York",
+    },
+    "sheets": [
+        {
             "properties": {
-                "title": "Test Spreadsheet",
-                "locale": "en_US",
-                "timeZone": "America/New_York",
-            },
-            "sheets": [
-                {
-                    "properties": {
-                        "sheetId": 0,
-                        "title": "Sheet1",
-                        "gridProperties": {
-                            "rowCount": 100,
-                            "columnCount": 26,
-                        },
-                    }
+                "sheetId": 0,
+                "title": "Sheet1",
+                "gridProperties": {
+                    "rowCount": 100,
+                    "columnCount": 26,
                 },
-                {
-                    "properties": {
-                        "sheetId": 1,
-                        "title": "Sheet2",
-                        "gridProperties": {
-                            "rowCount": 50,
-                            "columnCount": 10,
-                        },
-                    }
+            }
+        },
+        {
+            "properties": {
+                "sheetId": 1,
+                "title": "Sheet2",
+                "gridProperties": {
+                    "rowCount": 50,
+                    "columnCount": 10,
                 },
-            ],
-        }
+            }
+        },
+    ],
+}
+
+_META_NO_SHEETS = {
+    "spreadsheetId": "test-id",
+    "properties": {"title": "Test"},
+    "sheets": [],
+}
+
+_VALUES_OPPORTUNITIES = {
+    "values": [
+        ["id", "name", "amount"],
+        ["OPP-001", "Big Deal", "100000"],
+        ["OPP-002", "Small Deal", "5000"],
+    ]
+}
+
+
+# Module-scoped: the fake service and client are built once and reset
+# between tests instead of reconstructed per test
+@pytest.fixture(scope="module")
+def service():
+    """Create a fake Sheets API service."""
+    return FakeSheetsService()
+
+
+@pytest.fixture(scope="module")
+def client(service):
+    """Create a SheetsClient with the fake service."""
+    return SheetsClient(service=service)
+
+
+class TestSheetsClient:
+    """Test SheetsClient class."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self, client, service):
+        """Reset fake payloads and the client cache before each test."""
+        service.reset()
+        client._info_cache.clear()
+
+    def test_get_spreadsheet_info(self, client, service):
+        """Should parse spreadsheet metadata correctly."""
+        service.meta_payload = _META_TWO_SHEETS
 
         info = client.get_spreadsheet_info("test-id")
 
@@ -61,9 +163,9 @@ class TestSheetsClient:
         assert info.sheets[0].row_count == 100
         assert info.sheets[1].title == "Sheet2"
 
-    def test_list_sheets(self, client, mock_service):
-        """Should return list of sheet info dicts."""
-        mock_service.spreadsheets().get().execute.return_value = {
+    def test_list_sheets(self, client, service):
+        """Should return the SheetInfo objects from cached metadata."""
+        service.meta_payload = {
             "spreadsheetId": "test-id",
             "properties": {"title": "Test"},
             "sheets": [
@@ -80,12 +182,31 @@ class TestSheetsClient:
         sheets = client.list_sheets("test-id")
 
         assert len(sheets) == 1
-        assert sheets[0]["title"] == "Opportunities"
-        assert sheets[0]["sheet_id"] == 0
+        assert sheets[0].title == "Opportunities"
+        assert sheets[0].sheet_id == 0
+
+    def test_get_spreadsheet_info_cached(self, client, service):
+        """Should serve repeat metadata lookups from the client cache."""
+        service.meta_payload = _META_NO_SHEETS
+
+        client.get_spreadsheet_info("test-id")
+        client.get_spreadsheet_info("test-id")
+
+        assert service.meta_calls == 1
 
-    def test_get_headers(self, client, mock_service):
+    def test_refresh_info_invalidates_cache(self, client, service):
+        """Should refetch metadata after refresh_info."""
+        service.meta_payload = _META_NO_SHEETS
+
+        client.get_spreadsheet_info("test-id")
+        client.refresh_info("test-id")
+        client.get_spreadsheet_info("test-id")
+
+        assert service.meta_calls == 2
+
+    def test_get_headers(self, client, service):
         """Should return first row as headers."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values_payload = {
             "values": [["Name", "Email", "Amount", "Stage"]]
         }
 
@@ -93,133 +214,240 @@ class TestSheetsClient:
 
         assert headers == ["Name", "Email", "Amount", "Stage"]
 
-    def test_get_headers_empty(self, client, mock_service):
+    def test_get_headers_empty(self, client, service):
         """Should return empty list for empty sheet."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": []
-        }
+        service.values_payload = {"values": []}
 
         headers = client.get_headers("test-id", "Sheet1")
 
         assert headers == []
 
-    def test_read_sheet(self, client, mock_service):
-        """Should convert rows to dictionaries."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
+    @pytest.mark.parametrize(
+        "values,expected",
+        [
+            pytest.param(
+                [
+                    ["id", "name", "amount"],
+                    ["1", "Deal A", "10000"],
+                    ["2", "Deal B", "25000"],
+                ],
+                [
+                    {"id": "1", "name": "Deal A", "amount": "10000"},
+                    {"id": "2", "name": "Deal B", "amount": "25000"},
+                ],
+                id="rows-to-dicts",
+            ),
+            pytest.param(
+                [
+                    ["id", "name", "amount", "stage"],
+                    ["1", "Deal A"],  # Missing amount and stage
+                ],
+                [{"id": "1", "name": "Deal A", "amount": "", "stage": ""}],
+                id="missing-columns-padded",
+            ),
+            pytest.param([], [], id="empty-sheet"),
+        ],
+    )
+    def test_read_sheet(self, client, service, values, expected):
+        """Should convert rows to dictionaries, padding short rows."""
+        service.values_payload = {"values": values}
+
+        rows = client.read_sheet("test-id", "Sheet1")
+
+        assert rows == expected
+
+    def test_read_sheet_single_api_call(self, client, service):
+        """Should fetch headers and data rows in one API call."""
+        service.values_payload = {
             "values": [
-                ["id", "name", "amount"],
-                ["1", "Deal A", "10000"],
-                ["2", "Deal B", "25000"],
+                ["id", "name"],
+                ["1", "Deal A"],
             ]
         }
 
-        rows = client.read_sheet("test-id", "Opportunities")
+        client.read_sheet("test-id", "Sheet1")
 
-        assert len(rows) == 2
-        assert rows[0] == {"id": "1", "name": "Deal A", "amount": "10000"}
-        assert rows[1] == {"id": "2", "name": "Deal B", "amount": "25000"}
+        assert service.values_calls == 1
+        assert service.meta_calls == 0
+        assert service.batch_calls == 0
 
-    def test_read_sheet_missing_columns(self, client, mock_service):
-        """Should handle rows with fewer columns than headers."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
+    def test_read_sheet_columnar(self, client, service):
+        """Should transpose rows into per-column lists."""
+        service.values_payload = {
             "values": [
-                ["id", "name", "amount", "stage"],
-                ["1", "Deal A"],  # Missing amount and stage
+                ["id", "name", "amount"],
+                ["1", "Deal A", "10000"],
+                ["2", "Deal B"],  # Missing amount
             ]
         }
 
-        rows = client.read_sheet("test-id", "Sheet1")
-
-        assert len(rows) == 1
-        assert rows[0] == {"id": "1", "name": "Deal A", "amount": "", "stage": ""}
+        columns = client.read_sheet_columnar("test-id", "Sheet1")
 
-    def test_read_sheet_empty(self, client, mock_service):
-        """Should return empty list for empty sheet."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": []
+        assert columns == {
+            "id": ["1", "2"],
+            "name": ["Deal A", "Deal B"],
+            "amount": ["10000", ""],
         }
 
-        rows = client.read_sheet("test-id", "Sheet1")
+    def test_read_sheet_columnar_headers_only(self, client, service):
+        """Should return empty columns for a header-only sheet."""
+        service.values_payload = {"values": [["id", "name"]]}
+
+        columns = client.read_sheet_columnar("test-id", "Sheet1")
+
+        assert columns == {"id": [], "name": []}
+
+    @pytest.mark.parametrize(
+        "values,column,value,exact_match,expected_ids",
+        [
+            pytest.param(
+                [
+                    ["id", "owner", "stage"],
+                    ["1", "Alice", "Discovery"],
+                    ["2", "Bob", "Proposal"],
+                    ["3", "Alice", "Negotiation"],
+                ],
+                "owner",
+                "Alice",
+                True,
+                ["1", "3"],
+                id="exact-match",
+            ),
+            pytest.param(
+                [
+                    ["id", "subject"],
+                    ["1", "Important meeting request"],
+                    ["2", "Quick question"],
+                    ["3", "Meeting follow-up"],
+                ],
+                "subject",
+                "meeting",
+                False,
+                ["1", "3"],
+                id="contains-match",
+            ),
+            pytest.param(
+                [
+                    ["id", "owner"],
+                    ["1", "Alice"],
+                ],
+                "owner",
+                "Charlie",
+                True,
+                [],
+                id="no-match",
+            ),
+        ],
+    )
+    def test_find_rows(
+        self, client, service, values, column, value, exact_match, expected_ids
+    ):
+        """Should find the rows where the column matches the value."""
+        service.values_payload = {"values": values}
 
-        assert rows == []
+        matches = client.find_rows(
+            "test-id", "Sheet1", column, value, exact_match=exact_match
+        )
 
-    def test_find_rows_exact_match(self, client, mock_service):
-        """Should find rows with exact column match."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": [
-                ["id", "owner", "stage"],
-                ["1", "Alice", "Discovery"],
-                ["2", "Bob", "Proposal"],
-                ["3", "Alice", "Negotiation"],
+        assert [row["id"] for row in matches] == expected_ids
+
+    def test_read_sheets_batch(self, client, service):
+        """Should read multiple sheets in one batchGet call."""
+        service.batch_payload = {
+            "valueRanges": [
+                {
+                    "range": "'Deals'!A1:C3",
+                    "values": [
+                        ["id", "name"],
+                        ["1", "Deal A"],
+                    ],
+                },
+                {
+                    "range": "'Contacts'!A1:B2",
+                    "values": [
+                        ["id", "email"],
+                        ["1", "alice@example.com"],
+                    ],
+                },
             ]
         }
 
-        matches = client.find_rows("test-id", "Sheet1", "owner", "Alice")
+        results = client.read_sheets_batch(
+            "test-id", [("Deals", None), ("Contacts", None)]
+        )
 
-        assert len(matches) == 2
-        assert matches[0]["id"] == "1"
-        assert matches[1]["id"] == "3"
+        assert results["Deals"] == [{"id": "1", "name": "Deal A"}]
+        assert results["Contacts"] == [{"id": "1", "email": "alice@example.com"}]
+        assert service.batch_calls == 1
+        assert service.last_ranges == ["'Deals'", "'Contacts'"]
 
-    def test_find_rows_contains_match(self, client, mock_service):
-        """Should find rows with partial match when exact_match=False."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": [
-                ["id", "subject"],
-                ["1", "Important meeting request"],
-                ["2", "Quick question"],
-                ["3", "Meeting follow-up"],
+    def test_read_sheets_batch_empty_range(self, client, service):
+        """Should map an empty sheet to an empty list."""
+        service.batch_payload = {
+            "valueRanges": [
+                {"range": "'Empty'!A1"},
             ]
         }
 
-        matches = client.find_rows(
-            "test-id", "Sheet1", "subject", "meeting", exact_match=False
-        )
-
-        assert len(matches) == 2
-        assert matches[0]["id"] == "1"
-        assert matches[1]["id"] == "3"
-
-    def test_find_rows_no_match(self, client, mock_service):
-        """Should return empty list when no matches."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        results = client.read_sheets_batch("test-id", [("Empty", None)])
+
+        assert results == {"Empty": []}
+
+    @pytest.mark.parametrize(
+        "column,value,exact_match,expected",
+        [
+            pytest.param("owner", "Alice", True, 2, id="exact-match"),
+            pytest.param("stage", "covery", False, 1, id="contains-match"),
+            pytest.param("owner", "Charlie", True, 0, id="no-match"),
+            pytest.param("missing", "Alice", True, 0, id="unknown-column"),
+        ],
+    )
+    def test_count_rows(self, client, service, column, value, exact_match, expected):
+        """Should count matching rows without building them."""
+        service.values_payload = {
             "values": [
-                ["id", "owner"],
-                ["1", "Alice"],
+                ["id", "owner", "stage"],
+                ["1", "Alice", "Discovery"],
+                ["2", "Bob", "Proposal"],
+                ["3", "Alice", "Negotiation"],
             ]
         }
 
-        matches = client.find_rows("test-id", "Sheet1", "owner", "Charlie")
+        count = client.count_rows(
+            "test-id", "Sheet1", column, value, exact_match=exact_match
+        )
 
-        assert matches == []
+        assert count == expected
 
-    def test_get_row_by_id(self, client, mock_service):
-        """Should return single row by ID."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": [
-                ["id", "name", "amount"],
-                ["OPP-001", "Big Deal", "100000"],
-                ["OPP-002", "Small Deal", "5000"],
-            ]
-        }
+    @pytest.mark.parametrize(
+        "row_id,expected",
+        [
+            pytest.param(
+                "OPP-001",
+                {"id": "OPP-001", "name": "Big Deal", "amount": "100000"},
+                id="found",
+            ),
+            pytest.param("OPP-999", None, id="not-found"),
+        ],
+    )
+    def test_get_row_by_id(self, client, service, row_id, expected):
+        """Should return the single matching row, or None."""
+        service.values_payload = _VALUES_OPPORTUNITIES
 
-        row = client.get_row_by_id("test-id", "Sheet1", "id", "OPP-001")
+        row = client.get_row_by_id("test-id", "Sheet1", "id", row_id)
 
-        assert row is not None
-        assert row["name"] == "Big Deal"
-        assert row["amount"] == "100000"
+        assert row == expected
 
-    def test_get_row_by_id_not_found(self, client, mock_service):
-        """Should return None when ID not found."""
-        mock_service.spreadsheets().values().get().execute.return_value = {
-            "values": [
-                ["id", "name"],
-                ["OPP-001", "Deal"],
-            ]
-        }
+    def test_get_row_by_id_uses_index(self, client, service):
+        """Should serve repeat ID lookups from the index without refetching."""
+        service.values_payload = _VALUES_OPPORTUNITIES
 
-        row = client.get_row_by_id("test-id", "Sheet1", "id", "OPP-999")
+        first = client.get_row_by_id("test-id", "Sheet1", "id", "OPP-001")
+        second = client.get_row_by_id("test-id", "Sheet1", "id", "OPP-002")
 
-        assert row is None
+        assert first == {"id": "OPP-001", "name": "Big Deal", "amount": "100000"}
+        assert second == {"id": "OPP-002", "name": "Small Deal", "amount": "5000"}
+        assert service.values_calls == 1
 
 
 class TestSheetInfo:
@@ -238,6 +466,8 @@ class TestSheetInfo:
         assert info.title == "Test Sheet"
         assert info.row_count == 100
         assert info.column_count == 26
+        # slots=True: no per-instance __dict__
+        assert not hasattr(info, "__dict__")
 
 
 class TestSpreadsheetInfo: